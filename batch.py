@@ -0,0 +1,137 @@
+"""Monte Carlo comparison of the scheduling algorithms.
+
+Generates many random workloads and runs every registered algorithm on each
+of them, in both directions where the algorithm has one, spread over a
+process pool. Each workload is generated from its own seed, derived from the
+base seed and the workload index. Results are collected in index order, so the
+numbers are the same for any worker count or chunk size.
+
+Run ``python batch.py --help`` for the command-line options.
+"""
+
+import argparse
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import scheduler
+import vectorized
+
+WORKLOADS = ["uniform", "zipf", "hotspot", "sequential"]
+CONFIGS = scheduler.configs()
+# Two-sided 95% normal quantile for the confidence intervals
+Z_95 = 1.959964
+
+
+def generate_workload(kind, n, disk_size, rng, zipf_a=1.2, hot_fraction=0.2,
+                      hot_weight=0.8, burst_length=32):
+    """Return ``n`` request tracks drawn from the ``kind`` distribution.
+
+    * uniform: every track equally likely.
+    * zipf: track popularity follows a Zipf law with exponent ``zipf_a``; the
+      popular tracks are scattered over the disk by a random permutation.
+    * hotspot: ``hot_weight`` of the requests fall in a contiguous region that
+      covers ``hot_fraction`` of the disk.
+    * sequential: runs of ``burst_length`` consecutive tracks starting at
+      random positions.
+    """
+    if kind == "uniform":
+        return rng.integers(0, disk_size, size=n)
+    elif kind == "zipf":
+        ranks = rng.zipf(zipf_a, size=n) - 1
+        return rng.permutation(disk_size)[ranks % disk_size]
+    elif kind == "hotspot":
+        width = max(1, int(disk_size * hot_fraction))
+        start = rng.integers(0, disk_size - width + 1)
+        hot = rng.random(n) < hot_weight
+        tracks = rng.integers(0, disk_size, size=n)
+        tracks[hot] = start + rng.integers(0, width, size=int(hot.sum()))
+        return tracks
+    elif kind == "sequential":
+        bursts = -(-n // burst_length)
+        starts = rng.integers(0, disk_size, size=bursts)
+        offsets = np.arange(burst_length)
+        return ((starts[:, None] + offsets) % disk_size).ravel()[:n]
+    raise ValueError(f"Unknown workload: {kind}")
+
+
+def workload_rng(seed, index):
+    return np.random.default_rng(np.random.SeedSequence([seed, index]))
+
+
+def run_workload(index, kind, n, disk_size, seed):
+    """Total seek of every configuration in ``CONFIGS`` on workload ``index``."""
+    rng = workload_rng(seed, index)
+    requests = generate_workload(kind, n, disk_size, rng)
+    head = int(rng.integers(0, disk_size))
+    return [vectorized.run(algo, requests, head, disk_size, direction)[2]
+            for algo, direction in CONFIGS]
+
+
+def _run_chunk(args):
+    start, stop, kind, n, disk_size, seed = args
+    return [run_workload(i, kind, n, disk_size, seed) for i in range(start, stop)]
+
+
+def run_batch(workloads, kind="uniform", n=1000, disk_size=200, seed=0,
+              workers=None, chunksize=None):
+    """Return an int64 array of total seeks, one row per workload.
+
+    Columns follow ``CONFIGS``. ``workers`` defaults to the CPU count; with
+    ``workers=1`` everything runs in the calling process.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, math.ceil(workloads / (workers * 4)))
+    chunks = [(start, min(start + chunksize, workloads), kind, n, disk_size, seed)
+              for start in range(0, workloads, chunksize)]
+    if workers == 1:
+        rows = [row for chunk in map(_run_chunk, chunks) for row in chunk]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = [row for chunk in pool.map(_run_chunk, chunks) for row in chunk]
+    return np.array(rows, dtype=np.int64).reshape(workloads, len(CONFIGS))
+
+
+def summarize(totals, n):
+    """Mean and 95% confidence half-width of total and average seek per configuration."""
+    count = len(totals)
+    mean = totals.mean(axis=0)
+    if count > 1:
+        half = Z_95 * totals.std(axis=0, ddof=1) / math.sqrt(count)
+    else:
+        half = np.zeros(len(CONFIGS))
+    summary = {}
+    for i, (algo, direction) in enumerate(CONFIGS):
+        summary[scheduler.config_name(algo, direction)] = {
+            "total_seek_mean": float(mean[i]),
+            "total_seek_ci95": float(half[i]),
+            "avg_seek_mean": float(mean[i] / n),
+            "avg_seek_ci95": float(half[i] / n),
+        }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare disk scheduling algorithms over random workloads.")
+    parser.add_argument("--workloads", type=int, default=1000, help="number of workloads to generate")
+    parser.add_argument("--kind", choices=WORKLOADS, default="uniform", help="workload distribution")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per workload")
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    totals = run_batch(args.workloads, args.kind, args.requests, args.disk_size,
+                       args.seed, args.workers)
+    summary = summarize(totals, args.requests)
+    print(f"{args.workloads} {args.kind} workloads, {args.requests} requests, disk size {args.disk_size}")
+    print(f"{'Algorithm':<24}{'Total seek':>26}{'Average seek':>22}")
+    for name, s in summary.items():
+        print(f"{name:<24}{s['total_seek_mean']:>14.1f} ± {s['total_seek_ci95']:<9.1f}"
+              f"{s['avg_seek_mean']:>12.2f} ± {s['avg_seek_ci95']:<7.2f}")
+
+
+if __name__ == "__main__":
+    main()
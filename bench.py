@@ -0,0 +1,174 @@
+"""Scaling benchmarks for the scheduling engine and the renderer.
+
+Times every algorithm and direction on growing request counts for uniform,
+clustered and pre-sorted workloads. It also times the Agg rendering of the
+static plot and of a fixed number of animation frames. Rendering goes
+through matplotlib's Agg canvas directly, so no display is needed.
+
+Results are written as JSON. Passing an earlier result file with
+``--compare`` reports every case that got slower than ``--tolerance`` and
+exits with status 1 if there are any, so the script can gate CI runs:
+
+    python bench.py --output baseline.json
+    python bench.py --compare baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import batch
+import plotting
+import scheduler
+import vectorized
+
+SIZES = [10, 10**3, 10**5, 10**7]
+WORKLOADS = ["uniform", "clustered", "sorted"]
+DISK_SIZE = 100_000
+# Largest workload timed on the pure-Python engine and on the renderer
+PYTHON_LIMIT = 10**5
+RENDER_LIMIT = 10**7
+ANIMATION_LIMIT = 10**5
+
+
+def make_workload(kind, n, disk_size, seed=0):
+    rng = np.random.default_rng(seed)
+    if kind == "uniform":
+        return rng.integers(0, disk_size, size=n)
+    elif kind == "clustered":
+        return batch.generate_workload("hotspot", n, disk_size, rng)
+    elif kind == "sorted":
+        return np.sort(rng.integers(0, disk_size, size=n))
+    raise ValueError(f"Unknown workload: {kind}")
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_engine(requests, disk_size, repeat, python_limit):
+    """Yield ``(name, seconds)`` for every configuration on both engines."""
+    head = disk_size // 2
+    as_list = requests.tolist() if len(requests) <= python_limit else None
+    for algo, direction in scheduler.configs():
+        name = scheduler.config_name(algo, direction)
+        if algo in vectorized.VECTORIZED:
+            yield f"engine/vectorized/{name}", best_time(
+                lambda: vectorized.run(algo, requests, head, disk_size, direction), repeat)
+        if as_list is not None:
+            yield f"engine/python/{name}", best_time(
+                lambda: scheduler.run(algo, as_list, head, disk_size, direction), repeat)
+
+
+def new_figure():
+    fig = Figure(figsize=(10, 4))
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def bench_static_plot(requests, sequence, disk_size, repeat):
+    def render():
+        fig, ax = new_figure()
+        plotting.SequencePlot(fig, ax, requests, sequence, disk_size, "SCAN")
+        fig.canvas.draw()
+    return best_time(render, repeat)
+
+
+def bench_animation(requests, sequence, disk_size, frames):
+    """Seconds per frame for ``frames`` frames spread evenly over the sequence."""
+    fig, ax = new_figure()
+    animation = plotting.HeadAnimation(fig, ax, requests, sequence, disk_size, "SCAN")
+    fig.canvas.draw()
+    indices = np.linspace(0, len(sequence) - 1, frames).astype(int)
+    start = time.perf_counter()
+    for index in indices:
+        animation.update(index)
+        animation.blit()
+    return (time.perf_counter() - start) / frames
+
+
+def run(sizes=SIZES, workloads=WORKLOADS, disk_size=DISK_SIZE, repeat=3, frames=100,
+        python_limit=PYTHON_LIMIT, log=print):
+    results = {}
+    for kind in workloads:
+        for n in sizes:
+            requests = make_workload(kind, n, disk_size)
+            for name, seconds in bench_engine(requests, disk_size, repeat, python_limit):
+                results[f"{name}/{kind}/{n}"] = seconds
+                log(f"{name:<40} {kind:<10} {n:>10}  {seconds * 1000:10.3f} ms")
+            sequence, _, _ = vectorized.run("SCAN", requests, disk_size // 2, disk_size)
+            if n <= RENDER_LIMIT:
+                seconds = bench_static_plot(requests, sequence, disk_size, repeat)
+                results[f"render/static/{kind}/{n}"] = seconds
+                log(f"{'render/static':<40} {kind:<10} {n:>10}  {seconds * 1000:10.3f} ms")
+            if n <= ANIMATION_LIMIT:
+                seconds = bench_animation(requests, sequence, disk_size, frames)
+                results[f"render/frame/{kind}/{n}"] = seconds
+                log(f"{'render/frame':<40} {kind:<10} {n:>10}  {seconds * 1000:10.3f} ms")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return ``(name, old, new)`` for cases more than ``tolerance`` slower than baseline."""
+    return [(name, baseline[name], seconds) for name, seconds in results.items()
+            if name in baseline and seconds > baseline[name] * (1 + tolerance)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling engine and renderer.")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in SIZES),
+                        help="comma-separated request counts")
+    parser.add_argument("--workloads", default=",".join(WORKLOADS), help="comma-separated workload kinds")
+    parser.add_argument("--disk-size", type=int, default=DISK_SIZE)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best time is kept")
+    parser.add_argument("--frames", type=int, default=100, help="animation frames to time")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown relative to the baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(float(s)) for s in args.sizes.split(",")]
+    workloads = args.workloads.split(",")
+    results = run(sizes, workloads, args.disk_size, args.repeat, args.frames)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "platform": platform.platform(),
+            "disk_size": args.disk_size,
+            "repeat": args.repeat,
+            "frames": args.frames,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for name, old, new in regressions:
+            print(f"REGRESSION {name}: {old * 1000:.3f} ms -> {new * 1000:.3f} ms ({new / old:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.compare}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Memoized simulation results.
+
+``ResultCache`` is an LRU cache of engine results keyed on the algorithm,
+direction, head, disk size and a digest of the request array. It is bounded
+by the total size in bytes of the arrays it holds rather than by entry count,
+because a single result for a large trace can be hundreds of megabytes.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_BUDGET = 256 * 1024 * 1024
+
+
+def digest(requests):
+    """Content hash of a request array (or list)."""
+    arr = np.ascontiguousarray(np.asarray(requests))
+    h = hashlib.blake2b(digest_size=16)
+    h.update(arr.dtype.str.encode())
+    h.update(arr)
+    return h.hexdigest()
+
+
+def make_key(algo, direction, head, disk_size, requests, requests_digest=None):
+    """Cache key for a run. Pass ``requests_digest`` to reuse a digest computed earlier."""
+    return (algo, direction, int(head), int(disk_size), requests_digest or digest(requests))
+
+
+def _nbytes(value):
+    return sum(getattr(part, "nbytes", 0) for part in value)
+
+
+class ResultCache:
+    def __init__(self, max_bytes=DEFAULT_BUDGET):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Return the cached value for ``key`` (marking it recently used) or None."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store a tuple of result arrays, evicting least recently used entries.
+
+        A value larger than the whole budget is not cached.
+        """
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.bytes -= _nbytes(self.entries.pop(key))
+        while self.entries and self.bytes + size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= _nbytes(evicted)
+        self.entries[key] = value
+        self.bytes += size
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
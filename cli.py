@@ -0,0 +1,252 @@
+"""Command-line entry point for running the scheduler without the GUI.
+
+Runs one or more algorithms on requests given inline or loaded from a trace
+file and prints the metrics as JSON or CSV:
+
+    python cli.py --requests 50,82,120,30,140 --head 50 --algorithm SCAN
+    python cli.py --trace requests.bin --disk-size 100000 --format csv
+
+Only the pure-Python engine is imported up front. NumPy is loaded for trace
+files, timed arrivals and drive models, matplotlib for ``--plot`` and
+``--export``, and tkinter for ``--gui``. A plain run therefore starts quickly and works
+without a display.
+"""
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+
+import scheduler
+
+DEFAULT_DISK_SIZE = 200
+# Command-line overrides for drive.DriveModel parameters
+DRIVE_OPTIONS = ["rpm", "settle_ms", "track_to_track_ms", "full_stroke_ms", "knee", "sector_angle"]
+
+
+def parse_requests(text):
+    try:
+        return [int(x) for x in text.split(",") if x.strip()]
+    except ValueError:
+        raise ValueError(f"Requests must be comma-separated integers: {text}") from None
+
+
+def check_requests(requests, head, disk_size):
+    if not (0 <= head < disk_size):
+        raise ValueError(f"Head position must be between 0 and {disk_size-1}.")
+    if not requests:
+        raise ValueError("Please enter at least one disk request.")
+    bad = [r for r in requests if not (0 <= r < disk_size)]
+    if bad:
+        raise ValueError(f"Request(s) {', '.join(str(r) for r in bad[:10])} outside disk of size {disk_size}.")
+
+
+def selected_configs(algorithm, direction):
+    """``(algo, direction)`` pairs to run; non-directional algorithms run once."""
+    runs = []
+    for algo, algo_direction in scheduler.configs():
+        if algorithm not in ("all", algo):
+            continue
+        if algo in scheduler.DIRECTIONAL and direction not in ("both", algo_direction):
+            continue
+        runs.append((algo, algo_direction))
+    return runs
+
+
+def build_drive(args):
+    """A ``DriveModel`` from ``--drive`` and any overrides, or None if neither was given."""
+    overrides = {name: getattr(args, name) for name in DRIVE_OPTIONS if getattr(args, name) is not None}
+    if args.drive is None and not overrides:
+        return None
+    # drive imports NumPy, so it is only loaded when a model is requested
+    import drive
+    name = args.drive or drive.DEFAULT_PRESET
+    if name not in drive.PRESETS:
+        raise ValueError(f"Unknown drive preset {name!r}; choose from {', '.join(drive.PRESETS)}.")
+    params = dict(drive.PRESETS[name])
+    params.update(overrides)
+    return drive.DriveModel(**params)
+
+
+def run_config(algo, direction, requests, head, disk_size, arrivals=None, model=None):
+    """Return ``(sequence, row)`` where ``row`` is the metrics dict for one run.
+
+    With a drive ``model``, static runs also report times in milliseconds and
+    timed runs use the model's seek and rotation times.
+    """
+    row = {
+        "algorithm": scheduler.config_name(algo, direction),
+        "requests": len(requests),
+        "head": head,
+        "disk_size": disk_size,
+    }
+    if arrivals is not None:
+        import numpy as np
+        import simulation
+        order, finish, seek = simulation.simulate(arrivals, requests, head, disk_size, algo, direction,
+                                                  drive=model)
+        sequence = np.concatenate([[head], np.asarray(requests)[order]])
+        metrics = simulation.metrics(arrivals, finish, seek)
+        del metrics["requests"], metrics["total_seek"]
+    elif isinstance(requests, list):
+        sequence, seek = scheduler.run(algo, requests, head, disk_size, direction)
+        metrics = {}
+        if model is not None:
+            import numpy as np
+            metrics = model.report(np.abs(np.diff(sequence)), len(requests), disk_size)
+    else:
+        import vectorized
+        sequence, increments, seek = vectorized.run(algo, requests, head, disk_size, direction)
+        metrics = {} if model is None else model.report(increments, len(requests), disk_size)
+    row["total_seek"] = int(seek)
+    row["average_seek"] = seek / len(requests)
+    row.update(metrics)
+    return sequence, row
+
+
+def save_plot(path, requests, sequence, disk_size, name):
+    """Render the service sequence to an image file with the Agg backend."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    import plotting
+    fig = Figure(figsize=(10, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    plotting.SequencePlot(fig, ax, requests, sequence, disk_size, name)
+    fig.savefig(path)
+
+
+def plot_path(path, algo, direction, multiple):
+    if not multiple:
+        return path
+    root, ext = os.path.splitext(path)
+    suffix = algo if algo not in scheduler.DIRECTIONAL else f"{algo}_{direction}"
+    return f"{root}_{suffix.replace(' ', '_')}{ext}"
+
+
+def launch_gui(args):
+    import tkinter as tk
+
+    import main
+    root = tk.Tk()
+    app = main.DiskSchedulingSimulator(root)
+    if args.requests:
+        app.requests_entry.delete(0, tk.END)
+        app.requests_entry.insert(0, args.requests)
+    for entry, value in ((app.head_entry, args.head), (app.disk_size_entry, args.disk_size)):
+        if value is not None:
+            entry.delete(0, tk.END)
+            entry.insert(0, str(value))
+    root.mainloop()
+
+
+def write_output(rows, fmt, out):
+    if fmt == "json":
+        json.dump(rows, out, indent=2)
+        out.write("\n")
+    else:
+        writer = csv.DictWriter(out, fieldnames=list(rows[0]), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run disk scheduling algorithms and print their metrics.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--requests", help="comma-separated track numbers")
+    source.add_argument("--trace", help="trace file (.csv, .bin/.i32 or blkparse text)")
+    parser.add_argument("--sectors-per-track", type=int, default=1,
+                        help="sectors per track when reading blkparse traces (default 1)")
+    parser.add_argument("--head", type=int, help="initial head position (default 0)")
+    parser.add_argument("--disk-size", type=int, help=f"number of tracks (default {DEFAULT_DISK_SIZE})")
+    parser.add_argument("--algorithm", choices=scheduler.ALGORITHMS + ["all"], default="all")
+    parser.add_argument("--direction", choices=scheduler.DIRECTIONS + ["both"], default="both",
+                        help="sweep direction for the SCAN/LOOK family")
+    parser.add_argument("--arrival-rate", type=float, default=0.0,
+                        help="simulate Poisson arrivals at this many requests per ms")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the Poisson arrivals")
+    drive_group = parser.add_argument_group("drive model", "report times in ms; unset options come from --drive")
+    drive_group.add_argument("--drive", metavar="PRESET",
+                             help="drive preset, e.g. '15000 RPM server' (default: 7200 RPM desktop)")
+    drive_group.add_argument("--rpm", type=float)
+    drive_group.add_argument("--settle-ms", type=float)
+    drive_group.add_argument("--track-to-track-ms", type=float)
+    drive_group.add_argument("--full-stroke-ms", type=float)
+    drive_group.add_argument("--knee", type=float, help="fraction of the full stroke where seeks turn linear")
+    drive_group.add_argument("--sector-angle", type=float, help="degrees of rotation to transfer one request")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--sequence", action="store_true", help="include the service sequence (JSON only)")
+    parser.add_argument("--plot", metavar="PATH", help="save a plot of each run to this image file")
+    parser.add_argument("--export", metavar="PATH",
+                        help="save an animation of each run: .gif, .mp4 (needs ffmpeg) or a PNG frame directory")
+    parser.add_argument("--speed", type=float, default=2.0, help="animation head moves per second (default 2)")
+    parser.add_argument("--fps", type=float, default=30, help="animation frame rate (default 30)")
+    parser.add_argument("--gui", action="store_true", help="open the GUI with these inputs instead")
+    args = parser.parse_args(argv)
+
+    if args.gui:
+        launch_gui(args)
+        return
+    if args.head is None:
+        args.head = 0
+    if args.disk_size is None:
+        args.disk_size = DEFAULT_DISK_SIZE
+    if not args.requests and not args.trace:
+        parser.error("one of --requests or --trace is required")
+    if args.arrival_rate < 0:
+        parser.error("--arrival-rate cannot be negative")
+    if args.speed <= 0 or args.fps <= 0:
+        parser.error("--speed and --fps must be positive")
+    try:
+        model = build_drive(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    arrivals = None
+    try:
+        if args.trace:
+            import traces
+            if traces.guess_format(args.trace) == "blktrace":
+                # Replay the trace's own timestamps, converted from seconds to ms
+                times, requests = traces.load_blktrace(args.trace, sectors_per_track=args.sectors_per_track)
+                if len(times):
+                    arrivals = (times - times.min()) * 1000.0
+            else:
+                requests = traces.load_trace(args.trace)
+            if not (0 <= args.head < args.disk_size):
+                raise ValueError(f"Head position must be between 0 and {args.disk_size-1}.")
+            traces.validate_tracks(requests, args.disk_size)
+        else:
+            requests = parse_requests(args.requests)
+            check_requests(requests, args.head, args.disk_size)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if args.arrival_rate > 0:
+        import simulation
+        arrivals = simulation.poisson_arrivals(len(requests), args.arrival_rate, args.seed)
+
+    runs = selected_configs(args.algorithm, args.direction)
+    rows = []
+    for algo, direction in runs:
+        sequence, row = run_config(algo, direction, requests, args.head, args.disk_size, arrivals, model)
+        if args.sequence and args.format == "json":
+            row["sequence"] = [int(t) for t in sequence]
+        if args.plot:
+            save_plot(plot_path(args.plot, algo, direction, len(runs) > 1), requests, sequence,
+                      args.disk_size, row["algorithm"])
+        if args.export:
+            import export
+            try:
+                export.export_animation(plot_path(args.export, algo, direction, len(runs) > 1), requests,
+                                        sequence, args.disk_size, row["algorithm"], args.speed, args.fps)
+            except (OSError, RuntimeError, subprocess.CalledProcessError) as e:
+                parser.error(str(e))
+        rows.append(row)
+    write_output(rows, args.format, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Physical timing model of a disk drive.
+
+The rest of the simulator counts seek cost in tracks. ``DriveModel`` turns
+track distances into milliseconds:
+
+* Seek: a seek of ``d > 0`` tracks takes ``settle_ms`` plus a curve that
+  grows with ``sqrt(d)`` while the arm accelerates and decelerates. Past
+  the knee (``knee`` times the full stroke) the arm coasts, and the curve
+  grows linearly up to ``full_stroke_ms``. The two pieces meet with the
+  same slope. A zero-distance seek is free.
+* Rotation: once the head is on the track, it waits on average half a
+  revolution for the sector. It then reads for as long as the platter
+  takes to turn ``sector_angle`` degrees.
+
+Seek times are only computed for the distances a run actually uses. A
+report counts the distances with ``bincount`` when they are short enough
+for a table, and with ``np.unique`` otherwise. The event simulator memoizes
+one time per distance it meets. So neither one grows with the disk size,
+which can be billions of tracks for a raw sector trace. Because the C-SCAN
+return jump is a move of ``disk_size - 1`` tracks, it is charged as a
+full-stroke seek.
+"""
+
+import math
+
+import numpy as np
+
+# Longest seek table built for a report (32 MB of float64)
+TABLE_LIMIT = 1 << 22
+
+
+class DriveModel:
+    def __init__(self, rpm=7200, settle_ms=0.5, track_to_track_ms=0.5, full_stroke_ms=15.0,
+                 knee=0.3, sector_angle=1.0):
+        if rpm <= 0:
+            raise ValueError("RPM must be positive.")
+        if not (0 < knee <= 1):
+            raise ValueError("Knee must be in (0, 1].")
+        if full_stroke_ms < track_to_track_ms:
+            raise ValueError("Full-stroke seek cannot be faster than a track-to-track seek.")
+        self.rpm = rpm
+        self.settle_ms = settle_ms
+        self.track_to_track_ms = track_to_track_ms
+        self.full_stroke_ms = full_stroke_ms
+        self.knee = knee
+        self.sector_angle = sector_angle
+        self._tables = {}
+
+    @property
+    def rotation_ms(self):
+        return 60000.0 / self.rpm
+
+    @property
+    def latency_ms(self):
+        """Expected rotational latency: half a revolution."""
+        return self.rotation_ms / 2
+
+    @property
+    def transfer_ms(self):
+        return self.rotation_ms * self.sector_angle / 360.0
+
+    @property
+    def service_ms(self):
+        """Time spent on a request once the head has arrived on its track."""
+        return self.latency_ms + self.transfer_ms
+
+    def seek_curve(self, distance, disk_size):
+        """Seek time in ms for an array of distances ``>= 1`` (without settle)."""
+        distance = np.asarray(distance, dtype=np.float64)
+        stroke = disk_size - 1
+        t1, tf = self.track_to_track_ms, self.full_stroke_ms
+        if stroke <= 1:
+            return np.full(distance.shape, t1)
+        k = max(1.0, self.knee * stroke)
+        # t = a + b*sqrt(d) up to the knee, then a line with the same slope
+        # there: t = c + b*d / (2*sqrt(k)). Fixing t(1) = t1 and
+        # t(stroke) = tf gives b.
+        root = math.sqrt(k)
+        b = (tf - t1) / (root / 2 + stroke / (2 * root) - 1)
+        a = t1 - b
+        c = a + b * root / 2
+        return np.where(distance < k, a + b * np.sqrt(distance), c + b * distance / (2 * root))
+
+    def seek_times(self, distances, disk_size):
+        """Seek time in ms for an array of distances, including settle; 0 for no move."""
+        distances = np.asarray(distances)
+        curve = self.settle_ms + self.seek_curve(np.maximum(distances, 1), disk_size)
+        return np.where(distances > 0, curve, 0.0)
+
+    def seek_table(self, disk_size, max_distance=None):
+        """Seek time in ms for every distance ``0..max_distance``.
+
+        ``max_distance`` defaults to the full stroke. Full-stroke tables up to
+        ``TABLE_LIMIT`` entries are cached per disk size.
+        """
+        full = max_distance is None or max_distance >= disk_size - 1
+        if full and disk_size in self._tables:
+            return self._tables[disk_size]
+        length = disk_size if full else max_distance + 1
+        table = self.seek_times(np.arange(length), disk_size)
+        if full and length <= TABLE_LIMIT:
+            self._tables[disk_size] = table
+        return table
+
+    def seek_timer(self, disk_size):
+        """Function from one distance to its seek time in ms, memoized per distance."""
+        known = {0: 0.0}
+
+        def seek_ms(distance):
+            ms = known.get(distance)
+            if ms is None:
+                ms = known[distance] = float(self.seek_times(distance, disk_size))
+            return ms
+        return seek_ms
+
+    def report(self, increments, requests, disk_size):
+        """Time in ms to serve ``requests`` along a path with these seek increments."""
+        increments = np.asarray(increments)
+        max_distance = int(increments.max()) if len(increments) else 0
+        # Count each distance once rather than materializing a time per step
+        if max_distance < TABLE_LIMIT:
+            table = self.seek_table(disk_size, max_distance)
+            seek = float(np.bincount(increments, minlength=len(table))[:len(table)] @ table)
+        else:
+            distances, counts = np.unique(increments, return_counts=True)
+            seek = float(counts @ self.seek_times(distances, disk_size))
+        latency = requests * self.latency_ms
+        transfer = requests * self.transfer_ms
+        total = seek + latency + transfer
+        return {
+            "seek_ms": seek,
+            "rotational_latency_ms": latency,
+            "transfer_ms": transfer,
+            "total_ms": total,
+            "avg_ms_per_request": total / requests if requests else 0.0,
+        }
+
+
+DEFAULT_PRESET = "7200 RPM desktop"
+# Keyword arguments for DriveModel
+PRESETS = {
+    "5400 RPM laptop": dict(rpm=5400, settle_ms=0.6, track_to_track_ms=0.8, full_stroke_ms=20.0),
+    "7200 RPM desktop": dict(),
+    "15000 RPM server": dict(rpm=15000, settle_ms=0.3, track_to_track_ms=0.2, full_stroke_ms=7.0),
+}
@@ -0,0 +1,194 @@
+"""Offscreen export of head animations to GIF, MP4 or a PNG sequence.
+
+Frames are rendered with the Agg backend, so no display is needed. Each
+worker process builds one ``plotting.HeadAnimation`` per chunk of
+consecutive frames, draws the static figure once and then only blits the
+animated artists for each frame. ``HeadAnimation.update`` positions the
+artists for an absolute step, so chunks are independent and run in parallel
+on a process pool.
+
+Each distinct step is rendered once, however many output frames it stays
+on screen for. The time each frame is held is kept as a duration instead:
+GIF frames get their own delay, and PNG frames are listed with their
+durations in an ffmpeg concat file, ``frames.ffconcat``. For MP4, ffmpeg
+(which must be on the PATH) reads that file and repeats frames to reach a
+constant frame rate. For GIF, every worker maps its frames onto the
+same palette, taken from the final frame, and writes them as raw palette
+indices. Pillow then streams them into the GIF. With one shared palette,
+Pillow skips per-frame palette matching, and only one frame is in memory at
+a time.
+
+Output frame ``i`` shows step ``round(i * speed / fps)``, so the video plays
+at ``speed`` head moves per second, like the live animation.
+"""
+
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+FORMATS = ("gif", "mp4", "png")
+FRAME_NAME = "frame_{:06d}.png"
+RAW_NAME = "frame_{:06d}.raw"
+CONCAT_NAME = "frames.ffconcat"
+FIGSIZE = (10, 4)
+DPI = 100
+# A chunk pays for one full figure draw, so keep chunks at least this long
+MIN_CHUNK = 50
+GIF_COLORS = 64
+
+
+def output_format(path):
+    """Format implied by the file name: ``.gif``, ``.mp4``, or a PNG directory otherwise."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".gif", ".mp4"):
+        return ext[1:]
+    return "png"
+
+
+def frame_steps(length, speed, fps):
+    """Distinct steps to render and the durations in seconds they stay on screen.
+
+    At ``speed`` steps/sec and ``fps`` frames/sec, a slow animation shows one
+    step for several output frames and a fast one skips steps. The result
+    has one entry per distinct step shown.
+    """
+    if speed <= 0 or fps <= 0:
+        raise ValueError("Speed and frame rate must be positive.")
+    last = length - 1
+    steps_per_frame = speed / fps
+    count = math.ceil(last / steps_per_frame) + 1 if last > 0 else 1
+    shown = np.minimum(np.round(np.arange(count) * steps_per_frame).astype(np.int64), last)
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(shown)) + 1])
+    ticks = np.diff(np.append(starts, count))
+    return shown[starts], ticks / fps
+
+
+def render_frames(requests, sequence, disk_size, algo, frames, indices, directory, fmt="png",
+                  compress_level=6, figsize=FIGSIZE, dpi=DPI):
+    """Render ``frames[i]`` at step ``indices[i]`` into ``directory``.
+
+    Frames are PNG files, or raw palette indices for ``fmt="gif"``. Returns
+    ``(size, palette)``; ``palette`` is None unless ``fmt`` is "gif".
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from PIL import Image
+
+    import plotting
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    animation = plotting.HeadAnimation(fig, ax, requests, sequence, disk_size, algo)
+    # The full draw saves the static background; every frame after it is a blit
+    canvas.draw()
+    size = canvas.get_width_height()
+
+    def grab(index):
+        animation.update(index)
+        animation.blit()
+        return Image.frombuffer("RGBA", size, canvas.buffer_rgba(), "raw", "RGBA", 0, 1).convert("RGB")
+
+    palette = None
+    if fmt == "gif":
+        # The last frame shows every artist, so its colors cover the whole animation
+        palette = grab(len(sequence) - 1).quantize(colors=GIF_COLORS, method=Image.Quantize.FASTOCTREE)
+    for frame, index in zip(frames, indices):
+        image = grab(index)
+        if palette is None:
+            image.save(os.path.join(directory, FRAME_NAME.format(frame)), compress_level=compress_level)
+        else:
+            image = image.quantize(palette=palette, dither=Image.Dither.NONE)
+            with open(os.path.join(directory, RAW_NAME.format(frame)), "wb") as f:
+                f.write(image.tobytes())
+    animation.close()
+    return size, palette.getpalette() if palette is not None else None
+
+
+def _render_chunk(args):
+    return render_frames(*args)
+
+
+def export_animation(path, requests, sequence, disk_size, algo, speed=2.0, fps=30, workers=None):
+    """Write the animation of ``sequence`` to ``path`` and return the number of frames rendered.
+
+    ``path`` ending in ``.gif`` or ``.mp4`` selects that format. Any other
+    path is used as a directory of numbered PNG frames, with a ``.png``
+    suffix dropped. ``workers`` defaults to the CPU count. With ``workers=1``
+    everything renders in the calling process.
+    """
+    fmt = output_format(path)
+    if fmt == "mp4" and shutil.which("ffmpeg") is None:
+        raise RuntimeError("MP4 export needs ffmpeg on the PATH.")
+    requests = np.asarray(requests)
+    sequence = np.asarray(sequence)
+    indices, durations = frame_steps(len(sequence), speed, fps)
+    count = len(indices)
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(workers * 4, count // MIN_CHUNK))
+    bounds = np.linspace(0, count, chunks + 1).astype(int)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if fmt == "png":
+            directory = os.path.splitext(path)[0] if path.lower().endswith(".png") else path
+            os.makedirs(directory, exist_ok=True)
+        else:
+            directory = tmp
+        # Intermediate PNGs for ffmpeg favour speed over size
+        compress_level = 1 if fmt == "mp4" else 6
+        jobs = [(requests, sequence, disk_size, algo, range(start, stop), indices[start:stop], directory,
+                 fmt, compress_level) for start, stop in zip(bounds[:-1], bounds[1:])]
+        if workers == 1 or len(jobs) == 1:
+            results = list(map(_render_chunk, jobs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_render_chunk, jobs))
+
+        size, palette = results[0]
+        if fmt == "gif":
+            _write_gif(path, directory, count, size, palette, durations)
+        else:
+            _write_concat(directory, durations)
+        if fmt == "mp4":
+            _write_mp4(path, directory, fps)
+    return count
+
+
+def _write_concat(directory, durations):
+    with open(os.path.join(directory, CONCAT_NAME), "w") as f:
+        f.write("ffconcat version 1.0\n")
+        for i, seconds in enumerate(durations):
+            f.write(f"file {FRAME_NAME.format(i)}\nduration {seconds:.6f}\n")
+        # ffmpeg ignores the duration of the last entry unless its file is listed again
+        f.write(f"file {FRAME_NAME.format(len(durations) - 1)}\n")
+
+
+def _write_gif(path, directory, count, size, palette, durations):
+    from PIL import Image
+
+    def frames():
+        for i in range(count):
+            with open(os.path.join(directory, RAW_NAME.format(i)), "rb") as f:
+                image = Image.frombytes("P", size, f.read())
+            image.putpalette(palette)
+            yield image
+
+    # Round the running time rather than each frame, so delays do not drift
+    ends = np.round(np.cumsum(durations) * 1000)
+    delays = np.diff(ends, prepend=0).astype(int).tolist()
+    images = frames()
+    # Frames share one palette, so Pillow's palette optimization would only cost time
+    next(images).save(path, save_all=True, append_images=images, duration=delays, loop=0,
+                      optimize=False)
+
+
+def _write_mp4(path, directory, fps):
+    # The fps filter repeats frames to a constant rate; yuv420p needs even
+    # dimensions, so pad by a pixel if the figure size is odd
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-i", os.path.join(directory, CONCAT_NAME),
+                    "-vf", f"fps={fps},pad=ceil(iw/2)*2:ceil(ih/2)*2", "-c:v", "libx264", "-pix_fmt", "yuv420p",
+                    path], check=True)
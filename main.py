@@ -1,10 +1,38 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+import os
+import subprocess
 import time
-from threading import Thread
-import queue
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import cache
+import drive
+import export
+import plotting
+import profiling
+import scheduler
+import simulation
+import sweep
+import traces
+import vectorized
+
+# Largest workload for which every head move is written to the status screen
+TRACE_LIMIT = 500
+# Default animation speed (head moves per second) and redraw rate
+DEFAULT_SPEED = 2.0
+DEFAULT_FPS = 30
+# Live preview waits this long after the last edit before recomputing
+PREVIEW_DELAY_MS = 300
+PREVIEW_POLL_MS = 50
+# How often the GUI checks on a running animation export
+EXPORT_POLL_MS = 200
+# Number of disk sizes evaluated by the disk-size sweep
+SIZE_SWEEP_STEPS = 50
+# Drive model choice that keeps seek cost in tracks only
+NO_DRIVE = "Track distance"
+
 class DiskSchedulingSimulator:
     def __init__(self, root):  # Fixed typo: _init_ to __init__
         self.root = root
@@ -16,12 +44,36 @@ class DiskSchedulingSimulator:
         self.head = 0
         self.disk_size = 200
         self.direction = "outward"
-        self.animation_queue = queue.Queue()
-        self.animation_thread = None
+        self.animation = None
+        self.animation_index = 0
+        self.sequence_plot = None
+        self.sweep_colorbar = None
+        self.result_cache = cache.ResultCache()
+        self.preview_executor = ThreadPoolExecutor(max_workers=1)
+        self.export_executor = ThreadPoolExecutor(max_workers=1)
+        self.export_running = False
+        self.sweep_running = False
+        self.preview_job = None
+        self.preview_key = None
+        self.animation_job = None
+        self.animation_clock = 0.0
+        self.animation_carry = 0.0
         self.animation_running = False
         self.paused = False
         self.current_sequence = []
+        self.current_increments = None
         self.current_seek_time = 0
+        self.trace_requests = None
+        self.trace_times = None
+        # Requests entry text when the trace was loaded; editing it drops the trace
+        self.trace_entry_text = None
+        # A loaded trace never changes, so its digest and track range are computed once
+        self.trace_digest = None
+        self.trace_bounds = None
+        self.arrival_rate = 0.0
+        self.timer = profiling.NULL_TIMER
+        self.metrics_text = ""
+        self.drive_models = {}
         # Build the GUI
         self.build_gui()
         self.configure_status_text()  # Moved configuration to initialization
@@ -53,6 +105,18 @@ class DiskSchedulingSimulator:
         self.requests_entry.insert(0, "50, 82, 120, 30, 140, 10, 180, 65")
         self.requests_entry.pack(pady=5)
         self.requests_entry.bind("<KeyRelease>", self.on_input_change)
+        self.requests_entry.bind("<KeyRelease>", self.clear_trace, add="+")
+        # Trace file input
+        trace_frame = tk.Frame(self.left_frame, bg="#f4f6f8")
+        trace_frame.pack(anchor="w", pady=5)
+        ttk.Button(trace_frame, text="Load Trace...", command=self.load_trace).pack(side=tk.LEFT)
+        # blkparse reports sectors; this many sectors make one track
+        ttk.Label(trace_frame, text="Sectors/track:").pack(side=tk.LEFT, padx=(5, 2))
+        self.sectors_entry = ttk.Entry(trace_frame, width=6)
+        self.sectors_entry.insert(0, "1")
+        self.sectors_entry.pack(side=tk.LEFT)
+        self.trace_label = ttk.Label(trace_frame, text="")
+        self.trace_label.pack(side=tk.LEFT, padx=5)
         # Head position input
         ttk.Label(self.left_frame, text="Initial Head Position:").pack(anchor="w", pady=5)
         self.head_entry = ttk.Entry(self.left_frame, width=10)
@@ -70,19 +134,40 @@ class DiskSchedulingSimulator:
         ttk.Label(self.left_frame, text="Algorithm:").pack(anchor="w", pady=5)
         self.algo_var = tk.StringVar(value="FCFS")
         algo_menu = ttk.Combobox(self.left_frame, textvariable=self.algo_var, 
-                                values=["FCFS", "SSTF", "SCAN", "C-SCAN"], 
+                                values=scheduler.ALGORITHMS, 
                                 state="readonly", width=15)
         algo_menu.pack(pady=5)
         algo_menu.bind("<<ComboboxSelected>>", self.on_input_change)
         # Direction selection
-        ttk.Label(self.left_frame, text="Direction (SCAN/C-SCAN):").pack(anchor="w", pady=5)
+        ttk.Label(self.left_frame, text="Direction (SCAN/LOOK family):").pack(anchor="w", pady=5)
         self.dir_var = tk.StringVar(value="outward")
         dir_menu = ttk.Combobox(self.left_frame, textvariable=self.dir_var, 
-                               values=["outward", "inward"], state="readonly", width=15)
+                               values=scheduler.DIRECTIONS, state="readonly", width=15)
         dir_menu.pack(pady=5)
         dir_menu.bind("<<ComboboxSelected>>", self.on_input_change)
+        # Arrival rate input
+        ttk.Label(self.left_frame, text="Arrival Rate (req/ms, 0 = all queued):").pack(anchor="w", pady=5)
+        self.rate_entry = ttk.Entry(self.left_frame, width=10)
+        self.rate_entry.insert(0, "0")
+        self.rate_entry.pack(pady=5)
+        self.rate_entry.bind("<KeyRelease>", self.on_input_change)
+        # Drive timing model
+        ttk.Label(self.left_frame, text="Drive Model:").pack(anchor="w", pady=5)
+        self.drive_var = tk.StringVar(value=NO_DRIVE)
+        drive_menu = ttk.Combobox(self.left_frame, textvariable=self.drive_var,
+                                  values=[NO_DRIVE] + list(drive.PRESETS), state="readonly", width=18)
+        drive_menu.pack(pady=5)
+        drive_menu.bind("<<ComboboxSelected>>", self.on_input_change)
         # Simulation button
         ttk.Button(self.left_frame, text="Simulate", command=self.simulate).pack(pady=(15, 5))
+        self.preview_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.left_frame, text="Live preview", variable=self.preview_var,
+                        command=self.schedule_preview).pack(pady=(0, 5))
+        # Sweep buttons
+        sweep_frame = tk.Frame(self.left_frame, bg="#f4f6f8")
+        sweep_frame.pack(pady=5)
+        ttk.Button(sweep_frame, text="Head Sweep", command=self.head_sweep).grid(row=0, column=0, padx=5)
+        ttk.Button(sweep_frame, text="Size Sweep", command=self.size_sweep).grid(row=0, column=1, padx=5)
         # Animation control buttons
         button_frame = tk.Frame(self.left_frame, bg="#f4f6f8")
         button_frame.pack(pady=5)
@@ -92,6 +177,29 @@ class DiskSchedulingSimulator:
         self.pause_button.grid(row=0, column=1, padx=5)
         self.reset_button = ttk.Button(button_frame, text="Reset", command=self.reset)
         self.reset_button.grid(row=0, column=2, padx=5)
+        self.export_button = ttk.Button(button_frame, text="Export...", command=self.export_animation)
+        self.export_button.grid(row=0, column=3, padx=5)
+        # Animation speed controls
+        speed_frame = tk.Frame(self.left_frame, bg="#f4f6f8")
+        speed_frame.pack(pady=5)
+        ttk.Label(speed_frame, text="Steps/sec:").grid(row=0, column=0, padx=(0, 5))
+        self.speed_var = tk.StringVar(value=str(DEFAULT_SPEED))
+        ttk.Spinbox(speed_frame, textvariable=self.speed_var, from_=0.5, to=100000,
+                    increment=1, width=8).grid(row=0, column=1)
+        ttk.Label(speed_frame, text="FPS:").grid(row=0, column=2, padx=(10, 5))
+        self.fps_var = tk.StringVar(value=str(DEFAULT_FPS))
+        ttk.Spinbox(speed_frame, textvariable=self.fps_var, from_=1, to=120,
+                    increment=1, width=5).grid(row=0, column=3)
+        # Instrumentation controls
+        profile_frame = tk.Frame(self.left_frame, bg="#f4f6f8")
+        profile_frame.pack(pady=5)
+        self.instrument_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(profile_frame, text="Instrument", variable=self.instrument_var).grid(row=0, column=0, padx=5)
+        self.cprofile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(profile_frame, text="cProfile", variable=self.cprofile_var).grid(row=0, column=1, padx=5)
+        self.memory_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(profile_frame, text="Memory", variable=self.memory_var).grid(row=0, column=2, padx=5)
+        ttk.Button(profile_frame, text="Export Timings...", command=self.export_timings).grid(row=0, column=3, padx=5)
         # Metrics display
         self.metrics_frame = tk.LabelFrame(self.left_frame, text="Performance Metrics", 
                                          bg="#f4f6f8", fg="#333", font=("Segoe UI", 10, "bold"))
@@ -126,16 +234,24 @@ class DiskSchedulingSimulator:
         self.ax.grid(True, axis='x', linestyle='--')
         # Create canvas for embedding in Tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.right_frame)
+        # Toolbar zoom/pan lets large plots refine their level of detail
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self.right_frame)
+        self.toolbar.update()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def draw_canvas(self):
+        with self.timer.phase("canvas.draw"):
+            self.canvas.draw()
     def log_status(self, message, is_error=False):
         """Log a message to the status screen with appropriate color."""
-        # Insert the message
-        self.status_text.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {message}\n")
-        # Apply error tag only to the current line if it's an error
-        if is_error:
-            current_line = self.status_text.index(tk.END).split('.')[0]  # Get the line number
-            self.status_text.tag_add("error", f"{current_line}.0", f"{current_line}.0 lineend")
-        self.status_text.see(tk.END)  # Auto-scroll to the latest message
+        with self.timer.phase("log_status"):
+            # Insert the message
+            self.status_text.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {message}\n")
+            # Apply error tag only to the current line if it's an error
+            if is_error:
+                current_line = self.status_text.index(tk.END).split('.')[0]  # Get the line number
+                self.status_text.tag_add("error", f"{current_line}.0", f"{current_line}.0 lineend")
+            self.status_text.see(tk.END)  # Auto-scroll to the latest message
     def on_input_change(self, event):
         """Handle changes in input fields and log them."""
         try:
@@ -151,25 +267,46 @@ class DiskSchedulingSimulator:
         except ValueError:
             # Log an error if conversion fails (e.g., non-integer input)
             self.log_status("Invalid input detected. Please enter valid numbers.", is_error=True)
+            return
+        self.schedule_preview()
+
+    def parse_inputs(self):
+        """Read and check the input fields, raising ValueError on bad input.
+
+        Returns ``(requests, head, disk_size, arrival_rate)``.
+        """
+        head = int(self.head_entry.get())
+        disk_size = int(self.disk_size_entry.get())
+        arrival_rate = float(self.rate_entry.get() or 0)
+
+        if arrival_rate < 0:
+            raise ValueError("Arrival rate cannot be negative.")
+
+        if not (0 <= head < disk_size):
+            raise ValueError(f"Head position must be between 0 and {disk_size-1}.")
+
+        if self.trace_requests is not None:
+            requests = self.trace_requests
+            # Check the range saved at load time; only a failure rescans the trace for the message
+            if self.trace_bounds is None or self.trace_bounds[0] < 0 or self.trace_bounds[1] >= disk_size:
+                traces.validate_tracks(requests, disk_size)
+        else:
+            requests = [int(x.strip()) for x in self.requests_entry.get().split(",") if x.strip()]
+
+            if not requests:
+                raise ValueError("Please enter at least one disk request.")
+
+            # Check if any request exceeds disk size
+            if any(req >= disk_size for req in requests):
+                raise ValueError(f"Request(s) {', '.join(str(req) for req in requests if req >= disk_size)} exceed disk size of {disk_size}.")
+        return requests, head, disk_size, arrival_rate
 
     def validate_inputs(self):
         self.log_status("Validating inputs...")
         try:
             # Validate and parse inputs
-            self.requests = [int(x.strip()) for x in self.requests_entry.get().split(",") if x.strip()]
-            self.head = int(self.head_entry.get())
-            self.disk_size = int(self.disk_size_entry.get())
-            
-            if not self.requests:
-                raise ValueError("Please enter at least one disk request.")
-                
-            if not (0 <= self.head < self.disk_size):
-                raise ValueError(f"Head position must be between 0 and {self.disk_size-1}.")
-                
-            # Check if any request exceeds disk size
-            if any(req >= self.disk_size for req in self.requests):
-                raise ValueError(f"Request(s) {', '.join(str(req) for req in self.requests if req >= self.disk_size)} exceed disk size of {self.disk_size}.")
-                
+            with self.timer.phase("validate_inputs"):
+                self.requests, self.head, self.disk_size, self.arrival_rate = self.parse_inputs()
             self.log_status(f"Inputs validated successfully: {len(self.requests)} requests, Head={self.head}, Disk Size={self.disk_size}")
             self.play_button.config(state=tk.NORMAL)  # Enable play button on valid input
             return True
@@ -180,7 +317,63 @@ class DiskSchedulingSimulator:
             self.play_button.config(state=tk.DISABLED)  # Disable play button on invalid input
             return False
 
+    def load_trace(self):
+        path = filedialog.askopenfilename(
+            title="Load Request Trace",
+            filetypes=[("Trace files", "*.csv *.bin *.i32 *.txt *.blk"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            if traces.guess_format(path) == "blktrace":
+                try:
+                    sectors_per_track = int(self.sectors_entry.get())
+                except ValueError:
+                    raise ValueError("Sectors per track must be a whole number.") from None
+                # blkparse timestamps are in seconds, the simulation uses milliseconds
+                times, self.trace_requests = traces.load_blktrace(path, sectors_per_track=sectors_per_track)
+                self.trace_times = (times - times.min()) * 1000.0 if len(times) else None
+            else:
+                self.trace_requests = traces.load_trace(path)
+                self.trace_times = None
+        except (OSError, ValueError) as e:
+            self.log_status(f"Could not load trace: {e}", is_error=True)
+            messagebox.showerror("Invalid Trace", str(e))
+            return
+        name = os.path.basename(path)
+        self.trace_entry_text = self.requests_entry.get()
+        self.trace_digest = cache.digest(self.trace_requests)
+        if len(self.trace_requests):
+            self.trace_bounds = (int(self.trace_requests.min()), int(self.trace_requests.max()))
+        else:
+            self.trace_bounds = None
+        self.trace_label.config(text=f"{name} ({len(self.trace_requests)} requests)")
+        self.log_status(f"Loaded trace {name}: {len(self.trace_requests)} requests")
+        self.schedule_preview()
+
+    def clear_trace(self, event=None):
+        """Go back to the typed requests once the user edits them."""
+        # Keys that do not change the text (Tab, arrows, Ctrl+C) keep the trace
+        if self.trace_requests is not None and self.requests_entry.get() != self.trace_entry_text:
+            self.trace_requests = None
+            self.trace_times = None
+            self.trace_digest = None
+            self.trace_bounds = None
+            self.trace_label.config(text="")
+            self.log_status("Trace cleared, using typed requests.")
+
     def simulate(self):
+        if self.instrument_var.get():
+            self.timer = profiling.PhaseTimer(profile=self.cprofile_var.get(), memory=self.memory_var.get())
+        else:
+            self.timer = profiling.NULL_TIMER
+        self.timer.start()
+        try:
+            self.run_simulation()
+        finally:
+            self.timer.stop()
+        self.show_timings()
+
+    def run_simulation(self):
         if not self.validate_inputs():
             return
 
@@ -189,168 +382,281 @@ class DiskSchedulingSimulator:
         self.log_status(f"Starting simulation with {algo} algorithm, direction: {direction}")
         
         # Run the selected algorithm
-        self.current_sequence, self.current_seek_time = self.run_algorithm(algo, direction)
-        self.log_status(f"{algo}: Simulation completed. Final sequence: {self.current_sequence}, Total Seek Time: {self.current_seek_time}")
-        
+        timing = None
+        with self.timer.phase("run_algorithm"):
+            if self.arrival_rate > 0 or self.trace_times is not None:
+                self.current_sequence, self.current_increments, self.current_seek_time, timing = \
+                    self.run_timed(algo, direction)
+            else:
+                self.current_sequence, self.current_increments, self.current_seek_time = \
+                    self.run_algorithm(algo, direction)
+        if self.timer.enabled:
+            self.timer.steps = len(self.current_sequence) - 1
+        if len(self.current_sequence) <= TRACE_LIMIT:
+            self.log_status(f"{algo}: Simulation completed. Final sequence: {self.current_sequence}, Total Seek Time: {self.current_seek_time}")
+        else:
+            self.log_status(f"{algo}: Simulation completed. Sequence length: {len(self.current_sequence)}, Total Seek Time: {self.current_seek_time}")
+        self.show_results(algo, timing)
+
+    def show_results(self, algo, timing=None):
+        """Fill in the metrics panel and plot for the current sequence."""
         # Calculate performance metrics
         avg_seek_time = self.current_seek_time / len(self.requests)
         throughput = len(self.requests) / (self.current_seek_time + 1e-6)  # Avoid division by zero
         
         # Update metrics display
-        self.metrics_label.config(
-            text=f"Total Seek Time: {self.current_seek_time}\n"
-                 f"Average Seek Time: {avg_seek_time:.2f}\n"
-                 f"Throughput: {throughput:.2f} req/unit time\n"
-                 f"Total Requests: {len(self.requests)}"
-        )
+        text = (f"Total Seek Time: {self.current_seek_time}\n"
+                f"Average Seek Time: {avg_seek_time:.2f}\n"
+                f"Throughput: {throughput:.2f} req/unit time\n"
+                f"Total Requests: {len(self.requests)}")
+        if len(self.current_increments):
+            text += f"\nLongest Seek: {int(self.current_increments.max())}"
+        model = self.selected_drive()
+        if model is not None and not timing:
+            report = model.report(self.current_increments, len(self.requests), self.disk_size)
+            text += (f"\nSeek Time: {report['seek_ms']:.1f} ms\n"
+                     f"Rotation + Transfer: {report['rotational_latency_ms'] + report['transfer_ms']:.1f} ms\n"
+                     f"Service Time: {report['total_ms']:.1f} ms ({report['avg_ms_per_request']:.2f} ms/req)")
+        if timing:
+            text += (f"\nResponse p50/p95/p99: {timing['response_p50_ms']:.1f} / "
+                     f"{timing['response_p95_ms']:.1f} / {timing['response_p99_ms']:.1f} ms\n"
+                     f"Queue Depth mean/max: {timing['queue_depth_mean']:.2f} / {timing['queue_depth_max']}\n"
+                     f"Completion Rate: {timing['throughput_per_ms']:.3f} req/ms")
+        self.metrics_text = text
+        self.metrics_label.config(text=text)
         
         # Prepare the full visualization
         self.update_plot(self.current_sequence, algo)
 
+    def show_timings(self):
+        """Append the instrumentation summary to the metrics panel."""
+        if not self.timer.enabled:
+            return
+        lines = self.timer.summary()
+        if self.timer.profiler is not None:
+            lines.append("cProfile captured (export for details)")
+        self.metrics_label.config(text=self.metrics_text + "\n\nTimings:\n" + "\n".join(lines))
+
+    def export_timings(self):
+        if not self.timer.enabled:
+            self.log_status("Error: Tick Instrument and run a simulation first.", is_error=True)
+            return
+        path = filedialog.asksaveasfilename(title="Export Timings", defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            self.timer.save(path)
+        except OSError as e:
+            self.log_status(f"Could not export timings: {e}", is_error=True)
+            return
+        self.log_status(f"Timings exported to {os.path.basename(path)}")
+
+    def selected_drive(self):
+        """The chosen ``DriveModel``, or None to keep times in tracks."""
+        name = self.drive_var.get()
+        if name not in drive.PRESETS:
+            return None
+        if name not in self.drive_models:
+            # Keep one model per preset so its seek tables are reused
+            self.drive_models[name] = drive.DriveModel(**drive.PRESETS[name])
+        return self.drive_models[name]
+
     def run_algorithm(self, algo, direction):
-        req = self.requests.copy()
-        head = self.head
-        sequence = [head]
-        seek = 0
-
-        if algo == "FCFS":
-            self.log_status("FCFS: Starting algorithm execution...")
-            for r in req:
-                seek += abs(head - r)
-                head = r
-                sequence.append(r)
-                self.log_status(f"FCFS: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-                
-        elif algo == "SSTF":
-            self.log_status("SSTF: Starting algorithm execution...")
-            while req:
-                closest = min(req, key=lambda x: abs(head - x))
-                seek += abs(head - closest)
-                head = closest
-                sequence.append(closest)
-                req.remove(closest)
-                self.log_status(f"SSTF: Moving from {sequence[-2]} to {closest}, Seek increment: {abs(sequence[-2] - closest)}")
-                
-        elif algo == "SCAN":
-            self.log_status(f"SCAN: Starting algorithm execution, direction: {direction}...")
-            left = sorted([r for r in req if r < head])
-            right = sorted([r for r in req if r >= head])
-            
-            if direction == "outward":
-                for r in right:
-                    seek += abs(head - r)
-                    head = r
-                    sequence.append(r)
-                    self.log_status(f"SCAN: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-                if head != self.disk_size - 1:
-                    seek += abs(head - (self.disk_size - 1))
-                    head = self.disk_size - 1
-                    sequence.append(head)
-                    self.log_status(f"SCAN: Moving to end at {head}, Seek increment: {abs(sequence[-2] - head)}")
-                for r in reversed(left):
-                    seek += abs(head - r)
-                    head = r
-                    sequence.append(r)
-                    self.log_status(f"SCAN: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-            else:
-                for r in reversed(left):
-                    seek += abs(head - r)
-                    head = r
-                    sequence.append(r)
-                    self.log_status(f"SCAN: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-                if head != 0:
-                    seek += abs(head - 0)
-                    head = 0
-                    sequence.append(0)
-                    self.log_status(f"SCAN: Moving to start at {head}, Seek increment: {abs(sequence[-2] - head)}")
-                for r in right:
-                    seek += abs(head - r)
-                    head = r
-                    sequence.append(r)
-                    self.log_status(f"SCAN: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-                    
-        elif algo == "C-SCAN":
-            self.log_status(f"C-SCAN: Starting algorithm execution, direction: {direction}...")
-            left = sorted([r for r in req if r < head])
-            right = sorted([r for r in req if r >= head])
-            
-            if direction == "outward":
-                for r in right:
-                    seek += abs(head - r)
-                    head = r
-                    sequence.append(r)
-                    self.log_status(f"C-SCAN: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-                if head != self.disk_size - 1:
-                    seek += abs(head - (self.disk_size - 1))
-                    sequence.append(self.disk_size - 1)
-                    self.log_status(f"C-SCAN: Moving to end at {self.disk_size - 1}, Seek increment: {abs(sequence[-2] - (self.disk_size - 1))}")
-                seek += self.disk_size - 1
-                head = 0
-                sequence.append(0)
-                self.log_status(f"C-SCAN: Jumping to start at {head}, Seek increment: {self.disk_size - 1}")
-                for r in left:
-                    seek += abs(head - r)
-                    head = r
-                    sequence.append(r)
-                    self.log_status(f"C-SCAN: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-            else:
-                for r in reversed(left):
-                    seek += abs(head - r)
-                    head = r
-                    sequence.append(r)
-                    self.log_status(f"C-SCAN: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-                if head != 0:
-                    seek += abs(head - 0)
-                    sequence.append(0)
-                    self.log_status(f"C-SCAN: Moving to start at 0, Seek increment: {abs(sequence[-2] - 0)}")
-                seek += self.disk_size - 1
-                head = self.disk_size - 1
-                sequence.append(head)
-                self.log_status(f"C-SCAN: Jumping to end at {head}, Seek increment: {self.disk_size - 1}")
-                for r in reversed(right):
-                    seek += abs(head - r)
-                    head = r
-                    sequence.append(r)
-                    self.log_status(f"C-SCAN: Moving from {sequence[-2]} to {r}, Seek increment: {abs(sequence[-2] - r)}")
-
-        return sequence, seek
+        """Return ``(sequence, increments, total_seek)`` for the current inputs."""
+        # Per-step logging goes through the Tk text widget, so only trace small workloads
+        # and hand large ones to the NumPy engine
+        if len(self.requests) <= TRACE_LIMIT:
+            # A small loaded trace is an int32 array; plain ints keep the sums from wrapping
+            requests = np.asarray(self.requests).tolist()
+            sequence, seek = scheduler.run(algo, requests, self.head, self.disk_size, direction,
+                                           trace=self.log_status)
+            return sequence, np.abs(np.diff(sequence)), seek
+        key = cache.make_key(algo, direction, self.head, self.disk_size, self.requests,
+                             self.requests_digest(self.requests))
+        result = self.result_cache.get(key)
+        if result is None:
+            result = vectorized.run(algo, self.requests, self.head, self.disk_size, direction)
+            self.result_cache.put(key, result)
+        else:
+            self.log_status(f"{algo}: Reusing cached result.")
+        return result
+
+    def requests_digest(self, requests):
+        """The digest saved at load time for the loaded trace, None otherwise."""
+        return self.trace_digest if requests is self.trace_requests else None
+
+    def schedule_preview(self):
+        """Debounce live preview: recompute once input has been idle for a moment."""
+        if self.preview_job is not None:
+            self.root.after_cancel(self.preview_job)
+            self.preview_job = None
+        if self.preview_var.get():
+            self.preview_job = self.root.after(PREVIEW_DELAY_MS, self.start_preview)
+
+    def start_preview(self):
+        self.preview_job = None
+        if self.animation_running:
+            return
+        try:
+            requests, head, disk_size, arrival_rate = self.parse_inputs()
+        except ValueError as e:
+            self.log_status(f"Preview skipped: {e}", is_error=True)
+            return
+        if arrival_rate > 0 or self.trace_times is not None:
+            # Timed runs draw random arrivals, so they only run on Simulate
+            return
+        algo = self.algo_var.get()
+        direction = self.dir_var.get()
+        key = cache.make_key(algo, direction, head, disk_size, requests, self.requests_digest(requests))
+        self.preview_key = key
+        result = self.result_cache.get(key)
+        if result is not None:
+            self.apply_preview((requests, head, disk_size), algo, result)
+            return
+        # The engine runs on a worker thread; Tk is only touched from poll_preview
+        future = self.preview_executor.submit(vectorized.run, algo, requests, head, disk_size, direction)
+        self.root.after(PREVIEW_POLL_MS, self.poll_preview, future, key, (requests, head, disk_size), algo)
+
+    def poll_preview(self, future, key, inputs, algo):
+        if not future.done():
+            self.root.after(PREVIEW_POLL_MS, self.poll_preview, future, key, inputs, algo)
+            return
+        try:
+            result = future.result()
+        except ValueError as e:
+            self.log_status(f"Preview failed: {e}", is_error=True)
+            return
+        self.result_cache.put(key, result)
+        # Inputs may have changed while this was running; only show the latest
+        if key == self.preview_key:
+            self.apply_preview(inputs, algo, result)
+
+    def apply_preview(self, inputs, algo, result):
+        if self.animation_running:
+            return
+        self.requests, self.head, self.disk_size = inputs
+        self.current_sequence, self.current_increments, self.current_seek_time = result
+        self.log_status(f"{algo}: Preview updated, Total Seek Time: {self.current_seek_time}")
+        self.play_button.config(state=tk.NORMAL)
+        self.show_results(algo)
+
+    def run_timed(self, algo, direction):
+        """Run the event-driven simulation with trace timestamps or Poisson arrivals."""
+        if self.trace_times is not None:
+            arrivals = self.trace_times
+            self.log_status(f"{algo}: Replaying trace arrival times...")
+        else:
+            arrivals = simulation.poisson_arrivals(len(self.requests), self.arrival_rate)
+            self.log_status(f"{algo}: Simulating Poisson arrivals at {self.arrival_rate} req/ms...")
+        order, finish, seek = simulation.simulate(arrivals, self.requests, self.head, self.disk_size,
+                                                  algo, direction, drive=self.selected_drive())
+        timing = simulation.metrics(arrivals, finish, seek)
+        # Gather the served tracks straight into the sequence, keeping the request dtype.
+        # Turns at the disk ends are not part of it, so the increments can sum to less than seek.
+        requests = np.asarray(self.requests)
+        sequence = np.empty(len(order) + 1, dtype=requests.dtype)
+        sequence[0] = self.head
+        np.take(requests, order, out=sequence[1:])
+        increments = np.diff(sequence)
+        np.abs(increments, out=increments)
+        return sequence, increments, seek, timing
 
     def update_plot(self, sequence, algo):
-        self.ax.clear()
-        
-        # Plot the head movement path
-        self.ax.plot(sequence, [0]*len(sequence), '-o', color='#2c7bb6', 
-                     markersize=8, linewidth=2, label='Head Movement', alpha=0.7)
-        
-        # Mark the initial head position
-        self.ax.scatter([sequence[0]], [0], color='#d7191c', s=150, 
-                       label='Initial Head', zorder=5)
-        
-        # Mark all request positions
-        self.ax.scatter(self.requests, [0]*len(self.requests), color='#fdae61', 
-                       s=100, label='Requests', zorder=4)
-        
-        # Add track number labels for important points
-        for i, val in enumerate(sequence):
-            if i == 0 or i == len(sequence)-1 or val in [0, self.disk_size-1]:
-                self.ax.text(val, 0.02, str(val), ha='center', va='bottom', 
-                            fontsize=9, bbox=dict(facecolor='white', alpha=0.7, pad=1))
-        
-        # Set plot limits and labels
-        self.ax.set_ylim(-0.1, 0.1)
-        self.ax.set_yticks([])
-        self.ax.set_xlim(0, self.disk_size)
-        self.ax.set_xlabel("Track Number")
-        self.ax.set_title(f"{algo} Disk Scheduling Algorithm", pad=20)
-        self.ax.grid(True, axis='x', linestyle='--', alpha=0.6)
-        self.ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=3)
-        
-        # Adjust layout and draw
-        self.fig.tight_layout()
-        self.canvas.draw()
+        # Large workloads are binned and refined on zoom instead of drawing every point
+        self.stop_sequence_plot()
+        self.sequence_plot = plotting.SequencePlot(self.fig, self.ax, self.requests, sequence,
+                                                   self.disk_size, algo, timer=self.timer)
+        self.draw_canvas()
+
+    def stop_sequence_plot(self):
+        if self.sequence_plot is not None:
+            self.sequence_plot.close()
+            self.sequence_plot = None
+        if self.sweep_colorbar is not None:
+            self.sweep_colorbar.remove()
+            self.sweep_colorbar = None
+
+    def head_sweep(self):
+        """Plot total seek of every algorithm for each possible initial head position."""
+        if self.animation_running:
+            self.log_status("Error: Stop the animation before running a sweep.", is_error=True)
+            return
+        if self.sweep_running:
+            self.log_status("Sweep already running.")
+            return
+        if not self.validate_inputs():
+            return
+        self.log_status(f"Sweeping head positions 0-{self.disk_size - 1} for all algorithms...")
+        head = self.head
+        heads = sweep.sample_heads(self.disk_size, include=[head])
+        if len(heads) < self.disk_size:
+            self.log_status(f"Sampling {len(heads)} of {self.disk_size} head positions.")
+        self.run_sweep(sweep.sweep_all, (self.requests, self.disk_size, heads),
+                       lambda results: self.show_head_sweep(results, head, heads))
+
+    def show_head_sweep(self, results, head, heads):
+        skipped = [name for name in (sweep.config_name(algo, direction) for algo, direction in sweep.CONFIGS)
+                   if name not in results]
+        if skipped:
+            self.log_status(f"Skipped (no closed form or too large to sweep): {', '.join(skipped)}")
+        current = int(np.searchsorted(heads, head))
+        for name, totals in results.items():
+            best = int(np.argmin(totals))
+            self.log_status(f"{name}: Best head {heads[best]} (seek {totals[best]}), "
+                            f"at head {head}: {totals[current]}")
+        self.stop_sequence_plot()
+        plotting.draw_head_sweep(self.ax, results, head, heads, timer=self.timer)
+        self.draw_canvas()
+
+    def size_sweep(self):
+        """Heatmap of the selected algorithm over head positions and disk sizes up to the current one."""
+        if self.animation_running:
+            self.log_status("Error: Stop the animation before running a sweep.", is_error=True)
+            return
+        if self.sweep_running:
+            self.log_status("Sweep already running.")
+            return
+        if not self.validate_inputs():
+            return
+        algo = self.algo_var.get()
+        direction = self.dir_var.get()
+        smallest = int(np.max(self.requests)) + 1
+        sizes = np.unique(np.linspace(smallest, self.disk_size, SIZE_SWEEP_STEPS).astype(int)).tolist()
+        self.log_status(f"{algo}: Sweeping disk sizes {sizes[0]}-{sizes[-1]} over all head positions...")
+        name = sweep.config_name(algo, direction)
+        heads = sweep.sample_heads(self.disk_size)
+        self.run_sweep(sweep.size_sweep, (algo, self.requests, sizes, direction, heads),
+                       lambda grid: self.show_size_sweep(grid, sizes, name, heads))
+
+    def show_size_sweep(self, grid, sizes, name, heads):
+        self.stop_sequence_plot()
+        self.sweep_colorbar = plotting.draw_size_sweep(self.ax, grid, sizes, name, heads, timer=self.timer)
+        self.draw_canvas()
+
+    def run_sweep(self, fn, args, show):
+        """Run a sweep on the worker thread and pass its result to ``show`` on the Tk thread."""
+        self.sweep_running = True
+        future = self.preview_executor.submit(fn, *args)
+        self.root.after(PREVIEW_POLL_MS, self.poll_sweep, future, show)
+
+    def poll_sweep(self, future, show):
+        if not future.done():
+            self.root.after(PREVIEW_POLL_MS, self.poll_sweep, future, show)
+            return
+        self.sweep_running = False
+        try:
+            result = future.result()
+        except ValueError as e:
+            self.log_status(str(e), is_error=True)
+            return
+        if self.animation_running:
+            self.log_status("Sweep finished while the animation was running; not shown.")
+            return
+        show(result)
 
     def play_simulation(self):
-        if not hasattr(self, 'current_sequence') or not self.current_sequence:
+        if not hasattr(self, 'current_sequence') or len(self.current_sequence) == 0:
             self.log_status("Error: No simulation to play. Please run a simulation first.", is_error=True)
             messagebox.showwarning("No Simulation", "Please run a simulation first.")
             return
@@ -360,88 +666,133 @@ class DiskSchedulingSimulator:
             return
             
         self.log_status("Starting animation...")
-        # Clear any previous animation
-        while not self.animation_queue.empty():
-            self.animation_queue.get()
-            
-        # Prepare animation frames
-        for i in range(1, len(self.current_sequence)):
-            self.animation_queue.put((self.current_sequence[:i+1], self.current_sequence[i]))
-            
-        # Start animation thread
+        # Static parts are drawn once here; frames only move the animated artists
+        self.stop_animation_plot()
+        self.stop_sequence_plot()
+        self.animation = plotting.HeadAnimation(self.fig, self.ax, self.requests, self.current_sequence,
+                                                self.disk_size, self.algo_var.get(), timer=self.timer)
+        self.animation_index = 0
+        self.animation.update(0)
+        self.draw_canvas()
+
         self.animation_running = True
         self.paused = False
         self.play_button.config(state=tk.DISABLED)
         self.pause_button.config(state=tk.NORMAL)
-        
-        self.animation_thread = Thread(target=self.animate_movement, daemon=True)
-        self.animation_thread.start()
+        self.schedule_animation()
+
+    def animation_setting(self, var, default):
+        """Read a positive number from a speed control, falling back to the default."""
+        try:
+            value = float(var.get())
+        except (ValueError, tk.TclError):
+            return default
+        return value if value > 0 else default
+
+    def schedule_animation(self):
+        self.animation_clock = time.perf_counter()
+        self.animation_carry = 0.0
+        delay = int(1000 / self.animation_setting(self.fps_var, DEFAULT_FPS))
+        self.animation_job = self.root.after(delay, self.animate_movement)
 
     def animate_movement(self):
+        """Advance the animation by however many steps are due and draw one frame.
+
+        Runs on the Tk main loop via root.after at the target frame rate. When
+        the step rate is higher than the frame rate, the steps in between are
+        skipped rather than drawn.
+        """
+        self.animation_job = None
+        if not self.animation_running or self.paused:
+            return
+        now = time.perf_counter()
+        due = (now - self.animation_clock) * self.animation_setting(self.speed_var, DEFAULT_SPEED)
+        due += self.animation_carry
+        self.animation_clock = now
+        steps = int(due)
+        self.animation_carry = due - steps
+
+        last = len(self.current_sequence) - 1
+        if steps:
+            self.animation_index = min(self.animation_index + steps, last)
+            if len(self.current_sequence) <= TRACE_LIMIT:
+                self.log_status(f"{self.algo_var.get()}: Animating step: Moving to track "
+                                f"{self.current_sequence[self.animation_index]}")
+            self.update_animation_plot(self.animation_index)
+
+        if self.animation_index >= last:
+            self.log_status(f"{self.algo_var.get()}: Animation completed.")
+            self.animation_complete()
+            return
+        delay = int(1000 / self.animation_setting(self.fps_var, DEFAULT_FPS))
+        self.animation_job = self.root.after(delay, self.animate_movement)
+
+    def export_animation(self):
+        """Save the current animation to a GIF, MP4 or PNG frames off the Tk thread."""
+        if len(self.current_sequence) == 0:
+            self.log_status("Error: No simulation to export. Please run a simulation first.", is_error=True)
+            return
+        if self.export_running:
+            self.log_status("Export already running.")
+            return
+        path = filedialog.asksaveasfilename(title="Export Animation", defaultextension=".gif",
+                                            filetypes=[("GIF", "*.gif"), ("MP4 video", "*.mp4"),
+                                                       ("PNG frames", "*.png")])
+        if not path:
+            return
         algo = self.algo_var.get()
-        
-        while not self.animation_queue.empty() and self.animation_running:
-            if self.paused:
-                time.sleep(0.1)
-                continue
-                
-            sequence, current_pos = self.animation_queue.get()
-            self.log_status(f"{algo}: Animating step: Moving to track {current_pos}")
-            
-            # Update plot in main thread
-            self.root.after(0, self.update_animation_plot, sequence, current_pos, algo)
-            
-            # Control animation speed
-            time.sleep(0.5)
-            
-        # Animation complete
-        self.log_status(f"{algo}: Animation completed.")
-        self.root.after(0, self.animation_complete)
+        speed = self.animation_setting(self.speed_var, DEFAULT_SPEED)
+        fps = self.animation_setting(self.fps_var, DEFAULT_FPS)
+        # Frames render in worker processes; the thread only waits on them
+        future = self.export_executor.submit(export.export_animation, path, self.requests,
+                                             self.current_sequence, self.disk_size, algo, speed, fps)
+        self.export_running = True
+        self.export_button.config(state=tk.DISABLED)
+        self.log_status(f"{algo}: Exporting animation to {os.path.basename(path)}...")
+        self.root.after(EXPORT_POLL_MS, self.poll_export, future, path, time.perf_counter())
 
-    def update_animation_plot(self, sequence, current_pos, algo):
-        self.ax.clear()
-        
-        # Plot the path taken so far
-        self.ax.plot(sequence, [0]*len(sequence), '-o', color='#2c7bb6', 
-                     markersize=8, linewidth=2, label='Head Movement', alpha=0.7)
-        
-        # Mark the initial head position
-        self.ax.scatter([sequence[0]], [0], color='#d7191c', s=150, 
-                       label='Initial Head', zorder=5)
-        
-        # Mark all request positions
-        self.ax.scatter(self.requests, [0]*len(self.requests), color='#fdae61', 
-                       s=100, label='Requests', zorder=4)
-        
-        # Highlight current position
-        self.ax.scatter([current_pos], [0], color='#2c7bb6', s=200, 
-                       label='Current Position', zorder=6, edgecolor='black')
-        
-        # Add track number labels
-        for i, val in enumerate(sequence):
-            if i == 0 or i == len(sequence)-1 or val in [0, self.disk_size-1]:
-                self.ax.text(val, 0.02, str(val), ha='center', va='bottom', 
-                            fontsize=9, bbox=dict(facecolor='white', alpha=0.7, pad=1))
-        
-        # Set plot properties
-        self.ax.set_ylim(-0.1, 0.1)
-        self.ax.set_yticks([])
-        self.ax.set_xlim(0, self.disk_size)
-        self.ax.set_xlabel("Track Number")
-        self.ax.set_title(f"{algo} Disk Scheduling (Animating...)", pad=20)
-        self.ax.grid(True, axis='x', linestyle='--', alpha=0.6)
-        self.ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=4)
-        
-        self.fig.tight_layout()
-        self.canvas.draw()
+    def poll_export(self, future, path, start):
+        if not future.done():
+            self.root.after(EXPORT_POLL_MS, self.poll_export, future, path, start)
+            return
+        self.export_running = False
+        self.export_button.config(state=tk.NORMAL)
+        try:
+            frames = future.result()
+        except (OSError, RuntimeError, ValueError, subprocess.CalledProcessError) as e:
+            self.log_status(f"Could not export animation: {e}", is_error=True)
+            return
+        self.log_status(f"Exported {frames} frames to {os.path.basename(path)} "
+                        f"in {time.perf_counter() - start:.1f} s")
+
+    def cancel_animation_job(self):
+        if self.animation_job is not None:
+            self.root.after_cancel(self.animation_job)
+            self.animation_job = None
+
+    def update_animation_plot(self, index):
+        if self.animation is None:
+            return
+        with self.timer.phase("frame"):
+            self.animation.update(index)
+            self.animation.blit()
+
+    def stop_animation_plot(self):
+        """Detach the running animation's artists from the canvas."""
+        if self.animation is not None:
+            self.animation.close()
+            self.animation = None
 
     def animation_complete(self):
         self.animation_running = False
+        self.cancel_animation_job()
         self.play_button.config(state=tk.NORMAL)
         self.pause_button.config(state=tk.DISABLED)
         
         # Show complete visualization
+        self.stop_animation_plot()
         self.update_plot(self.current_sequence, self.algo_var.get())
+        self.show_timings()
 
     def pause_simulation(self):
         if not self.animation_running:
@@ -451,14 +802,17 @@ class DiskSchedulingSimulator:
         self.paused = not self.paused
         self.log_status(f"Animation {'paused' if self.paused else 'resumed'}.")
         if self.paused:
+            self.cancel_animation_job()
             self.pause_button.config(text="⏸ Paused")
         else:
+            self.schedule_animation()
             self.pause_button.config(text="⏸ Pause")
 
     def reset(self):
         # Stop any running animation
         self.animation_running = False
         self.paused = False
+        self.cancel_animation_job()
         self.log_status("Resetting simulation.")
         
         # Reset UI elements
@@ -469,6 +823,8 @@ class DiskSchedulingSimulator:
         self.metrics_label.config(text="")
         
         # Reset plot
+        self.stop_animation_plot()
+        self.stop_sequence_plot()
         self.ax.clear()
         self.ax.set_ylim(-0.1, 0.1)
         self.ax.set_yticks([])
@@ -476,7 +832,7 @@ class DiskSchedulingSimulator:
         self.ax.set_xlabel("Track Number")
         self.ax.set_title("Disk Scheduling Visualization")
         self.ax.grid(True, axis='x', linestyle='--')
-        self.canvas.draw()
+        self.draw_canvas()
 
     def configure_status_text(self):
         """Configure tags for the status text widget."""
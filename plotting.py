@@ -0,0 +1,294 @@
+"""Matplotlib drawing for the simulator, independent of the Tk window.
+
+``SequencePlot`` draws a finished simulation. Small workloads are drawn
+marker by marker. Above ``LOD_THRESHOLD`` points it switches to a
+level-of-detail view: requests become a density histogram over the visible
+tracks and visited tracks are binned into at most ``MAX_BINS`` markers. The
+view is rebuilt whenever the x-limits change, so zooming in refines it back
+to exact markers once few enough points are visible. In both modes, track
+labels outside the x-limits are hidden: Agg cannot rasterize text placed
+far outside the canvas, which happens when zooming in on a large disk. Bin counts come from
+binary searches into sorted copies of the data, so the cost of a redraw
+depends on the number of bins, not on the workload size.
+
+``HeadAnimation`` draws the static parts of an animation once: the axes, the
+request markers, the initial head and the legend. The moving parts are
+persistent animated artists updated with ``set_data``. Each frame only
+restores the saved background and redraws those few artists (blitting),
+instead of clearing and re-plotting the whole axes. The path already
+travelled is drawn into the saved background once the newest stretch of it
+grows past ``BAKE_STEPS`` moves, so a frame only redraws the moves made
+since then and its cost does not grow with the step index.
+"""
+
+import math
+
+import numpy as np
+
+from profiling import NULL_TIMER
+
+PATH_COLOR = "#2c7bb6"
+HEAD_COLOR = "#d7191c"
+REQUEST_COLOR = "#fdae61"
+LABEL_BOX = dict(facecolor="white", alpha=0.7, pad=1)
+# Above this many plotted points SequencePlot switches to binned rendering
+LOD_THRESHOLD = 2000
+MAX_BINS = 800
+# HeadAnimation bakes its path into the background once this many moves are animated
+BAKE_STEPS = 50
+
+
+def _label(ax, val, **kwargs):
+    return ax.text(val, 0.02, str(val), ha='center', va='bottom', fontsize=9, bbox=LABEL_BOX, **kwargs)
+
+
+class SequencePlot:
+    def __init__(self, fig, ax, requests, sequence, disk_size, algo, lod_threshold=LOD_THRESHOLD,
+                 timer=NULL_TIMER):
+        self.fig = fig
+        self.ax = ax
+        self.requests = np.asarray(requests)
+        self.sequence = np.asarray(sequence)
+        self.lod_threshold = lod_threshold
+        self.detail = []
+        self.labels = []
+        self.xlim_cid = None
+
+        ax.clear()
+        ax.scatter([self.sequence[0]], [0], color=HEAD_COLOR, s=150, label='Initial Head', zorder=5)
+        if len(self.sequence) + len(self.requests) <= lod_threshold:
+            self.draw_exact(disk_size)
+        else:
+            self.sorted_requests = np.sort(self.requests)
+            self.visited = np.unique(self.sequence)
+            # Label the start, the end and any visit to either end of the disk
+            marks = {self.sequence[0], self.sequence[-1]}
+            marks.update(end for end in (0, disk_size - 1) if self.is_visited(end))
+            for val in marks:
+                self.labels.append(_label(ax, val))
+            self.path, = ax.plot(self.visited[[0, -1]], [0, 0], '-', color=PATH_COLOR, linewidth=2,
+                                 label='Head Movement', alpha=0.7)
+
+        ax.set_ylim(-0.1, 0.1)
+        ax.set_yticks([])
+        ax.set_xlim(0, disk_size)
+        ax.set_xlabel("Track Number")
+        ax.set_title(f"{algo} Disk Scheduling Algorithm", pad=20)
+        ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+
+        if len(self.sequence) + len(self.requests) > lod_threshold:
+            self.refresh(ax)
+            self.xlim_cid = ax.callbacks.connect('xlim_changed', self.refresh)
+        else:
+            ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=3)
+            self.xlim_cid = ax.callbacks.connect('xlim_changed', self.clip_labels)
+        with timer.phase("tight_layout"):
+            fig.tight_layout()
+
+    def draw_exact(self, disk_size):
+        ax = self.ax
+        ax.plot(self.sequence, np.zeros(len(self.sequence)), '-o', color=PATH_COLOR,
+                markersize=8, linewidth=2, label='Head Movement', alpha=0.7)
+        ax.scatter(self.requests, np.zeros(len(self.requests)), color=REQUEST_COLOR,
+                   s=100, label='Requests', zorder=4)
+        last = len(self.sequence) - 1
+        for i, val in enumerate(self.sequence):
+            if i == 0 or i == last or val in (0, disk_size - 1):
+                self.labels.append(_label(ax, val))
+
+    def clip_labels(self, ax):
+        """Show only the track labels inside the current x-limits."""
+        lo, hi = sorted(ax.get_xlim())
+        for label in self.labels:
+            label.set_visible(bool(lo <= label.get_position()[0] <= hi))
+
+    def is_visited(self, track):
+        i = np.searchsorted(self.visited, track)
+        return i < len(self.visited) and self.visited[i] == track
+
+    def refresh(self, ax):
+        """Rebuild the data artists for the current x-limits."""
+        self.clip_labels(ax)
+        for artist in self.detail:
+            artist.remove()
+        self.detail = []
+        lo, hi = sorted(ax.get_xlim())
+        r0 = np.searchsorted(self.sorted_requests, lo)
+        r1 = np.searchsorted(self.sorted_requests, hi, side='right')
+        v0 = np.searchsorted(self.visited, lo)
+        v1 = np.searchsorted(self.visited, hi, side='right')
+
+        if (r1 - r0) + (v1 - v0) <= self.lod_threshold:
+            # Few enough points in view to draw every one of them
+            self.detail.append(ax.scatter(self.sorted_requests[r0:r1], np.zeros(r1 - r0),
+                                          color=REQUEST_COLOR, s=100, label='Requests', zorder=4))
+            marker_x = self.visited[v0:v1]
+            marker_size = 8
+        else:
+            bins = min(MAX_BINS, max(1, math.ceil(hi - lo)))
+            edges = np.linspace(lo, hi, bins + 1)
+            counts = np.diff(np.searchsorted(self.sorted_requests, edges))
+            heights = -0.1 + 0.08 * counts / max(1, counts.max())
+            self.detail.append(ax.stairs(heights, edges, baseline=-0.1, fill=True, color=REQUEST_COLOR,
+                                         alpha=0.8, label='Request Density', zorder=3))
+            occupied = np.diff(np.searchsorted(self.visited, edges)) > 0
+            marker_x = ((edges[:-1] + edges[1:]) / 2)[occupied]
+            marker_size = 4
+        self.detail.extend(ax.plot(marker_x, np.zeros(len(marker_x)), 'o', color=PATH_COLOR,
+                                   markersize=marker_size, alpha=0.7, zorder=4))
+        ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=3)
+
+    def close(self):
+        if self.xlim_cid is not None:
+            self.ax.callbacks.disconnect(self.xlim_cid)
+            self.xlim_cid = None
+
+
+class HeadAnimation:
+    def __init__(self, fig, ax, requests, sequence, disk_size, algo, timer=NULL_TIMER):
+        self.fig = fig
+        self.ax = ax
+        self.sequence = np.asarray(sequence)
+        self.zeros = np.zeros(len(self.sequence))
+        self.background = None
+        # Background without any path, and the last step whose path is baked into
+        # self.background (-1 for none)
+        self.clean_background = None
+        self.baked = -1
+        self.index = 0
+
+        ax.clear()
+        ax.scatter([self.sequence[0]], [0], color=HEAD_COLOR, s=150, label='Initial Head', zorder=5)
+        ax.scatter(requests, np.zeros(len(requests)), color=REQUEST_COLOR, s=100, label='Requests', zorder=4)
+        _label(ax, self.sequence[0])
+
+        self.path, = ax.plot([], [], '-o', color=PATH_COLOR, markersize=8, linewidth=2,
+                             label='Head Movement', alpha=0.7, animated=True)
+        self.current, = ax.plot([], [], 'o', color=PATH_COLOR, markersize=14, markeredgecolor='black',
+                                label='Current Position', zorder=6, animated=True)
+        self.current_label = _label(ax, "", animated=True)
+        # Disk ends get a permanent label once the head first reaches them
+        self.end_labels = []
+        for end in sorted({0, disk_size - 1}):
+            hits = np.flatnonzero(self.sequence[1:] == end)
+            if len(hits):
+                label = _label(ax, end, animated=True, visible=False)
+                self.end_labels.append((hits[0] + 1, label))
+
+        ax.set_ylim(-0.1, 0.1)
+        ax.set_yticks([])
+        ax.set_xlim(0, disk_size)
+        ax.set_xlabel("Track Number")
+        ax.set_title(f"{algo} Disk Scheduling (Animating...)", pad=20)
+        ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+        ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=4)
+        with timer.phase("tight_layout"):
+            fig.tight_layout()
+
+        self.artists = [self.path, self.current, self.current_label] + [label for _, label in self.end_labels]
+        self.draw_cid = fig.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def __len__(self):
+        return len(self.sequence)
+
+    def on_draw(self, event):
+        # A full redraw (first show, resize) invalidates the saved background
+        self.clean_background = self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self.baked = -1
+        self.set_path()
+        self.draw_artists()
+
+    def set_path(self):
+        """Show the moves from the baked step to the current one."""
+        start = max(self.baked, 0)
+        self.path.set_data(self.sequence[start:self.index + 1], self.zeros[start:self.index + 1])
+        # The baked step's marker is already in the background
+        self.path.set_markevery(slice(1, None) if self.baked >= 0 else None)
+
+    def bake(self):
+        """Draw the animated path into the background and start a new stretch."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        self.ax.draw_artist(self.path)
+        self.background = canvas.copy_from_bbox(self.fig.bbox)
+        self.baked = self.index
+        self.set_path()
+
+    def update(self, index):
+        """Move the animated artists to step ``index`` of the sequence."""
+        if index < self.baked:
+            # Going back: the baked path is ahead of this step, start over from the clean background
+            self.background = self.clean_background
+            self.baked = -1
+        self.index = index
+        self.set_path()
+        pos = self.sequence[index]
+        self.current.set_data([pos], [0])
+        self.current_label.set_position((pos, 0.02))
+        self.current_label.set_text(str(pos))
+        for first, label in self.end_labels:
+            label.set_visible(index >= first)
+
+    def draw_artists(self):
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+
+    def blit(self):
+        """Redraw only the animated artists on top of the saved background."""
+        canvas = self.fig.canvas
+        if self.background is None:
+            canvas.draw()
+            return
+        if self.index - self.baked > BAKE_STEPS:
+            self.bake()
+        canvas.restore_region(self.background)
+        self.draw_artists()
+        canvas.blit(self.fig.bbox)
+
+    def close(self):
+        self.fig.canvas.mpl_disconnect(self.draw_cid)
+
+
+def draw_head_sweep(ax, results, head=None, heads=None, timer=NULL_TIMER):
+    """Line chart of total seek against starting head position, one line per algorithm.
+
+    ``heads`` are the positions the totals were computed for (default: every one).
+    """
+    ax.clear()
+    for name, totals in results.items():
+        x = np.arange(len(totals)) if heads is None else heads
+        ax.plot(x, totals, linewidth=1.5, label=name)
+    if head is not None:
+        ax.axvline(head, color=HEAD_COLOR, linestyle='--', linewidth=1, label='Current Head')
+    ax.set_xlim(x[0], x[-1])
+    ax.set_xlabel("Initial Head Position")
+    ax.set_ylabel("Total Seek")
+    ax.set_title("Total Seek by Head Position", pad=20)
+    ax.grid(True, linestyle='--', alpha=0.6)
+    ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=4)
+    with timer.phase("tight_layout"):
+        ax.figure.tight_layout()
+
+
+def draw_size_sweep(ax, grid, disk_sizes, algo, heads=None, timer=NULL_TIMER):
+    """Heatmap of total seek over head position (x) and disk size (y).
+
+    ``heads`` are the evenly spaced positions of the grid columns (default:
+    every one). Returns the colorbar so the caller can remove it before
+    reusing the axes.
+    """
+    ax.clear()
+    first, last = (0, grid.shape[1] - 1) if heads is None else (heads[0], heads[-1])
+    half = (last - first) / max(1, grid.shape[1] - 1) / 2
+    image = ax.imshow(grid, aspect='auto', origin='lower', interpolation='nearest', cmap='viridis',
+                      extent=(first - half, last + half, -0.5, len(disk_sizes) - 0.5))
+    ticks = np.unique(np.linspace(0, len(disk_sizes) - 1, min(len(disk_sizes), 8)).astype(int))
+    ax.set_yticks(ticks)
+    ax.set_yticklabels([str(disk_sizes[i]) for i in ticks])
+    ax.set_xlabel("Initial Head Position")
+    ax.set_ylabel("Disk Size")
+    ax.set_title(f"{algo} Total Seek by Head Position and Disk Size", pad=20)
+    colorbar = ax.figure.colorbar(image, ax=ax, label="Total Seek")
+    with timer.phase("tight_layout"):
+        ax.figure.tight_layout()
+    return colorbar
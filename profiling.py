@@ -0,0 +1,117 @@
+"""Wall-clock instrumentation for the GUI hot paths.
+
+``PhaseTimer.phase(name)`` is a context manager. It adds the elapsed time
+and one call to the named phase. Phases may nest, and each one reports
+inclusive time. ``start`` and ``stop`` bracket a run. In between, cProfile
+records every call when the timer was created with ``profile=True``, and
+tracemalloc records peak traced memory with ``memory=True``. Both are opt-in
+because they slow down pure-Python code several times more than NumPy code,
+which skews the phase times.
+
+With instrumentation off, the GUI uses ``NULL_TIMER``. Its ``phase``
+returns one shared no-op context manager, so an instrumented call site
+only costs a method call.
+"""
+
+import contextlib
+import cProfile
+import json
+import pstats
+import time
+import tracemalloc
+
+# Functions listed from the cProfile capture, by cumulative time
+PROFILE_LIMIT = 25
+
+
+class PhaseTimer:
+    enabled = True
+
+    def __init__(self, profile=False, memory=False):
+        self.phases = {}
+        self.steps = 0
+        self.peak_memory = None
+        self.profiler = cProfile.Profile() if profile else None
+        self.memory = memory
+        self._owns_tracemalloc = False
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds, calls = self.phases.get(name, (0.0, 0))
+            self.phases[name] = (seconds + time.perf_counter() - start, calls + 1)
+
+    def start(self):
+        if self.memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def stop(self):
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.memory and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+                self._owns_tracemalloc = False
+
+    def profile_stats(self, limit=PROFILE_LIMIT):
+        """Top ``limit`` functions from the cProfile capture, by cumulative time."""
+        if self.profiler is None:
+            return []
+        stats = pstats.Stats(self.profiler).sort_stats("cumulative")
+        rows = []
+        for func in stats.fcn_list[:limit]:
+            _, calls, total, cumulative, _ = stats.stats[func]
+            filename, line, name = func
+            rows.append({"function": f"{filename}:{line}({name})", "calls": calls,
+                         "total_s": total, "cumulative_s": cumulative})
+        return rows
+
+    def report(self):
+        return {
+            "phases": {name: {"seconds": seconds, "calls": calls}
+                       for name, (seconds, calls) in self.phases.items()},
+            "steps": self.steps,
+            "peak_memory_bytes": self.peak_memory,
+            "profile": self.profile_stats(),
+        }
+
+    def summary(self):
+        """Lines for the metrics panel, slowest phase first."""
+        lines = [f"{name}: {seconds * 1000:.1f} ms ({calls}x)"
+                 for name, (seconds, calls) in sorted(self.phases.items(), key=lambda item: -item[1][0])]
+        lines.append(f"Steps: {self.steps}")
+        if self.peak_memory is not None:
+            lines.append(f"Peak Memory: {self.peak_memory / 2**20:.1f} MB")
+        return lines
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+class _NullTimer:
+    enabled = False
+    steps = 0
+
+    def phase(self, name):
+        return _NULL_PHASE
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+_NULL_PHASE = contextlib.nullcontext()
+NULL_TIMER = _NullTimer()
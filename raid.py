@@ -0,0 +1,199 @@
+"""Striped disk arrays: RAID-0 and RAID-10.
+
+Logical tracks are split into stripe units of ``stripe`` tracks, which are
+laid out round-robin over the data disks:
+
+* RAID-0: unit ``u`` lives on disk ``u % disks``, at offset ``u // disks``.
+* RAID-10: the disks form ``disks // 2`` mirrored pairs, and the units are
+  striped over the pairs. A write goes to both disks of its pair. Reads
+  alternate between the two copies in arrival order.
+
+Every disk then serves its own queue, in arrival order, with its own head
+and the chosen algorithm. The disks are independent, so they are scheduled in
+parallel on a process pool. All requests are queued at time 0. A disk's busy
+time is its seek time plus a fixed service time per request, or the
+``drive.DriveModel`` time when a model is given. The array finishes when its
+busiest disk does.
+
+Run ``python raid.py --help`` for the command-line options.
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import batch
+import scheduler
+import traces
+import vectorized
+
+LEVELS = ["0", "10"]
+
+
+def _disk_dtype(disks):
+    # 16-bit disk numbers let NumPy's stable argsort use radix sort
+    return np.int16 if disks <= np.iinfo(np.int16).max else np.int32
+
+
+def disk_tracks(disk_size, disks, stripe, level="0"):
+    """Physical tracks per member disk for a logical volume of ``disk_size`` tracks."""
+    data_disks = disks // 2 if level == "10" else disks
+    units = -(-disk_size // stripe)
+    return -(-units // data_disks) * stripe
+
+
+def map_requests(requests, disks, stripe, level="0", writes=False):
+    """Map logical tracks onto the array.
+
+    Returns ``(disk, track)`` arrays with one entry per physical request, in
+    arrival order. For RAID-10 writes there are two entries per logical
+    request.
+    """
+    if level not in LEVELS:
+        raise ValueError(f"Unknown RAID level: {level}")
+    if level == "10" and (disks < 2 or disks % 2):
+        raise ValueError("RAID-10 needs an even number of disks.")
+    if disks < 1 or stripe < 1:
+        raise ValueError("Disk count and stripe size must be positive.")
+    requests = np.asarray(requests)
+    data_disks = disks // 2 if level == "10" else disks
+    unit, offset = np.divmod(requests, stripe)
+    member = (unit % data_disks).astype(_disk_dtype(disks))
+    track = ((unit // data_disks) * stripe + offset).astype(traces.TRACK_DTYPE)
+    if level == "0":
+        return member, track
+    # Disks 2p and 2p+1 mirror pair p
+    if writes:
+        return np.concatenate([2 * member, 2 * member + 1]), np.concatenate([track, track])
+    # Alternate reads between the copies, counting per pair in arrival order
+    order = np.argsort(member, kind="stable")
+    counts = np.bincount(member, minlength=data_disks)
+    rank = np.empty(len(member), dtype=np.int64)
+    rank[order] = np.arange(len(member)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return 2 * member + (rank % 2).astype(member.dtype), track
+
+
+def split_by_disk(member, track, disks):
+    """One array of tracks per disk, each in arrival order."""
+    order = np.argsort(member, kind="stable")
+    counts = np.bincount(member, minlength=disks)
+    return np.split(track[order], np.cumsum(counts)[:-1])
+
+
+def run_disk(algo, direction, tracks, head, disk_size, track_time=0.1, service_time=1.0, drive=None):
+    """Schedule one member disk and return its summary dict."""
+    if len(tracks) == 0:
+        return {"requests": 0, "total_seek": 0, "busy_ms": 0.0}
+    _, increments, seek = vectorized.run(algo, tracks, head, disk_size, direction)
+    if drive is None:
+        busy = seek * track_time + len(tracks) * service_time
+    else:
+        busy = drive.report(increments, len(tracks), disk_size)["total_ms"]
+    return {"requests": len(tracks), "total_seek": seek, "busy_ms": busy}
+
+
+def _run_disk(args):
+    return run_disk(*args)
+
+
+def simulate_array(requests, disk_size, disks, stripe, level="0", algo="SCAN", direction="outward",
+                   head=0, writes=False, track_time=0.1, service_time=1.0, drive=None, workers=None):
+    """Simulate an array and return ``(per_disk, summary)``.
+
+    ``disk_size`` is the size of the logical volume, and ``head`` the initial
+    physical track of every disk. ``workers`` defaults to the CPU count. With
+    ``workers=1`` every disk runs in the calling process.
+    """
+    member, track = map_requests(requests, disks, stripe, level, writes)
+    size = disk_tracks(disk_size, disks, stripe, level)
+    if not (0 <= head < size):
+        raise ValueError(f"Head position must be between 0 and {size-1}.")
+    jobs = [(algo, direction, tracks, head, size, track_time, service_time, drive)
+            for tracks in split_by_disk(member, track, disks)]
+    workers = min(workers or os.cpu_count() or 1, disks)
+    if workers == 1:
+        per_disk = list(map(_run_disk, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Largest queues first so a long disk does not start last
+            order = sorted(range(disks), key=lambda i: -len(jobs[i][2]))
+            results = dict(zip(order, pool.map(_run_disk, [jobs[i] for i in order])))
+        per_disk = [results[i] for i in range(disks)]
+    return per_disk, summarize(per_disk)
+
+
+def summarize(per_disk):
+    """Makespan, total seek and load imbalance of an array run.
+
+    Imbalance is the busiest disk's time (or request count) over the mean.
+    1.0 means a perfectly even load.
+    """
+    busy = np.array([d["busy_ms"] for d in per_disk])
+    counts = np.array([d["requests"] for d in per_disk])
+    return {
+        "disks": len(per_disk),
+        "physical_requests": int(counts.sum()),
+        "total_seek": int(sum(d["total_seek"] for d in per_disk)),
+        "makespan_ms": float(busy.max()),
+        "busy_mean_ms": float(busy.mean()),
+        "time_imbalance": float(busy.max() / busy.mean()) if busy.mean() > 0 else 1.0,
+        "request_imbalance": float(counts.max() / counts.mean()) if counts.mean() > 0 else 1.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate a striped RAID-0/RAID-10 disk array.")
+    parser.add_argument("--trace", help="trace of logical tracks (default: a random workload)")
+    parser.add_argument("--kind", choices=batch.WORKLOADS, default="uniform", help="random workload distribution")
+    parser.add_argument("--requests", type=int, default=1_000_000, help="random workload size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--disk-size", type=int, default=1_000_000, help="logical volume size in tracks")
+    parser.add_argument("--disks", type=int, default=8)
+    parser.add_argument("--level", choices=LEVELS, default="0")
+    parser.add_argument("--stripe", type=int, default=64, help="stripe unit in tracks")
+    parser.add_argument("--writes", action="store_true", help="treat requests as writes (RAID-10 mirrors both)")
+    parser.add_argument("--algorithm", choices=scheduler.ALGORITHMS, default="SCAN")
+    parser.add_argument("--direction", choices=scheduler.DIRECTIONS, default="outward")
+    parser.add_argument("--head", type=int, default=0, help="initial physical track of every disk")
+    parser.add_argument("--drive", metavar="PRESET", help="time seeks with a drive.PRESETS model")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    model = None
+    if args.drive:
+        import drive
+        if args.drive not in drive.PRESETS:
+            parser.error(f"Unknown drive preset {args.drive!r}; choose from {', '.join(drive.PRESETS)}.")
+        model = drive.DriveModel(**drive.PRESETS[args.drive])
+    try:
+        if args.trace:
+            requests = traces.load_trace(args.trace)
+        else:
+            rng = np.random.default_rng(args.seed)
+            requests = batch.generate_workload(args.kind, args.requests, args.disk_size, rng)
+        traces.validate_tracks(requests, args.disk_size)
+        per_disk, summary = simulate_array(requests, args.disk_size, args.disks, args.stripe, args.level,
+                                           args.algorithm, args.direction, args.head, args.writes,
+                                           drive=model, workers=args.workers)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.json:
+        print(json.dumps({"summary": summary, "disks": per_disk}, indent=2))
+        return
+    name = scheduler.config_name(args.algorithm, args.direction)
+    print(f"RAID-{args.level}, {args.disks} disks, stripe {args.stripe}, {name}: "
+          f"{len(requests)} logical requests")
+    print(f"{'Disk':>4}{'Requests':>12}{'Total seek':>16}{'Busy ms':>14}")
+    for i, d in enumerate(per_disk):
+        print(f"{i:>4}{d['requests']:>12}{d['total_seek']:>16}{d['busy_ms']:>14.1f}")
+    print(f"Makespan: {summary['makespan_ms']:.1f} ms, total seek: {summary['total_seek']}, "
+          f"imbalance: {summary['time_imbalance']:.3f} (time), {summary['request_imbalance']:.3f} (requests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""Headless disk scheduling engine.
+
+The functions here take plain sequences of track numbers and return the
+service sequence (starting with the initial head position) together with the
+total seek distance. They do not depend on tkinter or matplotlib, so they can
+be imported from scripts and batch jobs as well as from the GUI.
+
+Algorithms are looked up by name in ``REGISTRY``. New ones are added with the
+``register`` decorator and must accept
+``(requests, head, disk_size, direction, trace)``.
+
+Per-step tracing is optional: pass a callable as ``trace`` and it will be
+called with one human-readable message per head move. It is off by default
+because formatting a message for every step dominates the run time on large
+workloads.
+"""
+
+from bisect import bisect_left
+
+from sortedindex import SortedIndex
+
+REGISTRY = {}
+ALGORITHMS = []
+# Algorithms whose result depends on the sweep direction
+DIRECTIONAL = set()
+DIRECTIONS = ["outward", "inward"]
+# Requests per batch for N-step SCAN
+NSTEP_SIZE = 10
+
+
+def register(name, directional=True):
+    """Add a scheduling function to the registry under ``name``."""
+    def decorator(fn):
+        REGISTRY[name] = fn
+        ALGORITHMS.append(name)
+        if directional:
+            DIRECTIONAL.add(name)
+        return fn
+    return decorator
+
+
+def configs():
+    """Every (algorithm, direction) pair worth comparing."""
+    return [(algo, direction) for algo in ALGORITHMS
+            for direction in (DIRECTIONS if algo in DIRECTIONAL else DIRECTIONS[:1])]
+
+
+def config_name(algo, direction):
+    return f"{algo} ({direction})" if algo in DIRECTIONAL else algo
+
+
+@register("FCFS", directional=False)
+def fcfs(requests, head, disk_size=None, direction="outward", trace=None):
+    sequence = [head]
+    seek = 0
+    if trace:
+        trace("FCFS: Starting algorithm execution...")
+    for r in requests:
+        step = abs(head - r)
+        seek += step
+        if trace:
+            trace(f"FCFS: Moving from {head} to {r}, Seek increment: {step}")
+        head = r
+        sequence.append(r)
+    return sequence, seek
+
+
+@register("SSTF", directional=False)
+def sstf(requests, head, disk_size=None, direction="outward", trace=None):
+    """Shortest seek time first in O(n log n).
+
+    The requests are grouped by track and sorted once. The tracks already
+    served always form a contiguous run of that sorted order with the head
+    at one end, so the next closest track is one of the two neighbours of
+    the run and each step is O(1). Ties between a track below and a track
+    above the head go to whichever appears first in ``requests``, which is
+    what ``min()`` over the pending list would pick.
+    """
+    first = {}
+    count = {}
+    for i, r in enumerate(requests):
+        if r in count:
+            count[r] += 1
+        else:
+            first[r] = i
+            count[r] = 1
+    tracks = sorted(count)
+
+    sequence = [head]
+    seek = 0
+    if trace:
+        trace("SSTF: Starting algorithm execution...")
+    hi = bisect_left(tracks, head)
+    lo = hi - 1
+    while lo >= 0 or hi < len(tracks):
+        if hi >= len(tracks):
+            go_low = True
+        elif lo < 0:
+            go_low = False
+        else:
+            below = head - tracks[lo]
+            above = tracks[hi] - head
+            if below != above:
+                go_low = below < above
+            else:
+                go_low = first[tracks[lo]] < first[tracks[hi]]
+        if go_low:
+            closest = tracks[lo]
+            lo -= 1
+        else:
+            closest = tracks[hi]
+            hi += 1
+        step = abs(head - closest)
+        seek += step
+        if trace:
+            trace(f"SSTF: Moving from {head} to {closest}, Seek increment: {step}")
+            for _ in range(count[closest] - 1):
+                trace(f"SSTF: Moving from {closest} to {closest}, Seek increment: 0")
+        head = closest
+        sequence.extend([closest] * count[closest])
+    return sequence, seek
+
+
+def _sweep(name, order, head, sequence, seek, trace):
+    """Serve ``order`` one track at a time, appending to ``sequence``."""
+    for r in order:
+        step = abs(head - r)
+        seek += step
+        if trace:
+            trace(f"{name}: Moving from {head} to {r}, Seek increment: {step}")
+        head = r
+        sequence.append(r)
+    return head, seek
+
+
+def _scan(name, requests, head, disk_size, direction, trace):
+    sequence = [head]
+    seek = 0
+    if trace:
+        trace(f"{name}: Starting algorithm execution, direction: {direction}...")
+    left = sorted(r for r in requests if r < head)
+    right = sorted(r for r in requests if r >= head)
+
+    if direction == "outward":
+        head, seek = _sweep(name, right, head, sequence, seek, trace)
+        if head != disk_size - 1:
+            step = abs(head - (disk_size - 1))
+            seek += step
+            head = disk_size - 1
+            sequence.append(head)
+            if trace:
+                trace(f"{name}: Moving to end at {head}, Seek increment: {step}")
+        head, seek = _sweep(name, reversed(left), head, sequence, seek, trace)
+    else:
+        head, seek = _sweep(name, reversed(left), head, sequence, seek, trace)
+        if head != 0:
+            step = head
+            seek += step
+            head = 0
+            sequence.append(0)
+            if trace:
+                trace(f"{name}: Moving to start at {head}, Seek increment: {step}")
+        head, seek = _sweep(name, right, head, sequence, seek, trace)
+    return sequence, seek
+
+
+@register("SCAN")
+def scan(requests, head, disk_size, direction="outward", trace=None):
+    return _scan("SCAN", requests, head, disk_size, direction, trace)
+
+
+@register("C-SCAN")
+def cscan(requests, head, disk_size, direction="outward", trace=None):
+    sequence = [head]
+    seek = 0
+    if trace:
+        trace(f"C-SCAN: Starting algorithm execution, direction: {direction}...")
+    left = sorted(r for r in requests if r < head)
+    right = sorted(r for r in requests if r >= head)
+
+    if direction == "outward":
+        head, seek = _sweep("C-SCAN", right, head, sequence, seek, trace)
+        if head != disk_size - 1:
+            step = abs(head - (disk_size - 1))
+            seek += step
+            sequence.append(disk_size - 1)
+            if trace:
+                trace(f"C-SCAN: Moving to end at {disk_size - 1}, Seek increment: {step}")
+        seek += disk_size - 1
+        head = 0
+        sequence.append(0)
+        if trace:
+            trace(f"C-SCAN: Jumping to start at {head}, Seek increment: {disk_size - 1}")
+        head, seek = _sweep("C-SCAN", left, head, sequence, seek, trace)
+    else:
+        head, seek = _sweep("C-SCAN", reversed(left), head, sequence, seek, trace)
+        if head != 0:
+            seek += head
+            sequence.append(0)
+            if trace:
+                trace(f"C-SCAN: Moving to start at 0, Seek increment: {head}")
+        seek += disk_size - 1
+        head = disk_size - 1
+        sequence.append(head)
+        if trace:
+            trace(f"C-SCAN: Jumping to end at {head}, Seek increment: {disk_size - 1}")
+        head, seek = _sweep("C-SCAN", reversed(right), head, sequence, seek, trace)
+    return sequence, seek
+
+
+@register("LOOK")
+def look(requests, head, disk_size, direction="outward", trace=None):
+    """SCAN that reverses at the last request instead of the end of the disk."""
+    sequence = [head]
+    seek = 0
+    if trace:
+        trace(f"LOOK: Starting algorithm execution, direction: {direction}...")
+    left = sorted(r for r in requests if r < head)
+    right = sorted(r for r in requests if r >= head)
+    if direction == "outward":
+        head, seek = _sweep("LOOK", right, head, sequence, seek, trace)
+        head, seek = _sweep("LOOK", reversed(left), head, sequence, seek, trace)
+    else:
+        head, seek = _sweep("LOOK", reversed(left), head, sequence, seek, trace)
+        head, seek = _sweep("LOOK", right, head, sequence, seek, trace)
+    return sequence, seek
+
+
+@register("C-LOOK")
+def clook(requests, head, disk_size, direction="outward", trace=None):
+    """C-SCAN that jumps straight to the farthest request on the other side.
+
+    The jump is charged as its actual distance.
+    """
+    sequence = [head]
+    seek = 0
+    if trace:
+        trace(f"C-LOOK: Starting algorithm execution, direction: {direction}...")
+    left = sorted(r for r in requests if r < head)
+    right = sorted(r for r in requests if r >= head)
+    if direction == "outward":
+        ahead, behind = right, left
+    else:
+        ahead, behind = left[::-1], right[::-1]
+    head, seek = _sweep("C-LOOK", ahead, head, sequence, seek, trace)
+    if behind:
+        step = abs(head - behind[0])
+        seek += step
+        head = behind[0]
+        sequence.append(head)
+        if trace:
+            trace(f"C-LOOK: Jumping to {head}, Seek increment: {step}")
+        head, seek = _sweep("C-LOOK", behind[1:], head, sequence, seek, trace)
+    return sequence, seek
+
+
+@register("N-STEP SCAN")
+def nstep_scan(requests, head, disk_size, direction="outward", trace=None, batch_size=NSTEP_SIZE):
+    """SCAN over successive batches of ``batch_size`` requests in arrival order.
+
+    Each batch is added to a ``SortedIndex`` and served by an elevator that
+    keeps its direction between batches. The head only runs to the end of the
+    disk when it has to turn around.
+    """
+    sequence = [head]
+    seek = 0
+    if trace:
+        trace(f"N-STEP SCAN: Starting algorithm execution, direction: {direction}, batch size: {batch_size}...")
+    outward = direction == "outward"
+    pending = SortedIndex()
+    for start in range(0, len(requests), batch_size):
+        for r in requests[start:start + batch_size]:
+            pending.add(r)
+        while pending:
+            r = pending.ceiling(head) if outward else pending.floor(head)
+            if r is None:
+                end = disk_size - 1 if outward else 0
+                if head != end:
+                    step = abs(head - end)
+                    seek += step
+                    head = end
+                    sequence.append(end)
+                    if trace:
+                        trace(f"N-STEP SCAN: Moving to {'end' if outward else 'start'} at {end}, Seek increment: {step}")
+                outward = not outward
+                continue
+            pending.remove(r)
+            head, seek = _sweep("N-STEP SCAN", [r], head, sequence, seek, trace)
+    return sequence, seek
+
+
+@register("FSCAN")
+def fscan(requests, head, disk_size, direction="outward", trace=None):
+    """FSCAN with every request queued at time 0.
+
+    The frozen queue then holds the whole workload, so it is served by a
+    single SCAN pass. The two-queue behaviour only shows up with timed
+    arrivals (see ``simulation``).
+    """
+    return _scan("FSCAN", requests, head, disk_size, direction, trace)
+
+
+def run(algo, requests, head, disk_size, direction="outward", trace=None):
+    """Run ``algo`` on ``requests`` and return ``(sequence, total_seek)``."""
+    fn = REGISTRY.get(algo)
+    if fn is None:
+        raise ValueError(f"Unknown algorithm: {algo}")
+    return fn(requests, head, disk_size, direction, trace)
@@ -0,0 +1,210 @@
+"""Discrete-event simulation of a disk with timed request arrivals.
+
+Unlike ``scheduler``, which assumes every request is queued at time 0, this
+module replays requests that arrive over time. Requests that have arrived
+but not been served wait in a pending queue, and the scheduler picks the next
+one online each time the head finishes a request. With an idle queue the clock
+skips ahead to the next arrival.
+
+Time is in milliseconds. Moving the head costs ``track_time`` per track and
+serving a request costs a fixed ``service_time``. Passing a
+``drive.DriveModel`` replaces both with its seek curve and rotational
+latency plus transfer time.
+
+Pending requests are kept in a ``SortedIndex`` of integer keys
+``track * n + index``. This gives ordering by track and then by arrival, and
+the nearest request on either side of the head is a single lookup. FCFS only
+needs a pointer into the arrival order. N-step SCAN and FSCAN hold new
+arrivals in a FIFO and move them into the index when the current batch
+drains, so a refill costs O(log n) per request instead of a re-sort.
+
+Like ``scheduler``, the sweeping algorithms count requests on the starting
+track as lying outward of the head. An inward sweep therefore leaves them
+for the way back. Once the head has moved or served a request, the track it
+is on counts as ahead in either direction. N-step SCAN always counts it as
+ahead, as ``scheduler.nstep_scan`` does. With every arrival at time 0, the
+total seek matches ``scheduler.run``. The one exception is the end of a
+run: the simulation stops at the last request, while ``scheduler`` SCAN and
+C-SCAN still run to the end of the disk when nothing is left behind the head.
+"""
+
+from collections import deque
+from functools import partial
+from operator import mul
+
+import numpy as np
+
+import scheduler
+from sortedindex import SortedIndex
+
+ALGORITHMS = scheduler.ALGORITHMS
+PERCENTILES = (50, 95, 99)
+# What the head does when nothing is pending ahead of it
+_AT_END = {
+    "SCAN": "reverse_at_end",
+    "N-STEP SCAN": "reverse_at_end",
+    "FSCAN": "reverse_at_end",
+    "C-SCAN": "wrap_at_end",
+    "LOOK": "reverse",
+    "C-LOOK": "wrap",
+}
+_BATCHED = ("N-STEP SCAN", "FSCAN")
+
+
+def poisson_arrivals(n, rate, seed=None):
+    """Arrival times of ``n`` requests at ``rate`` requests per millisecond."""
+    rng = np.random.default_rng(seed)
+    return np.cumsum(rng.exponential(1.0 / rate, size=n))
+
+
+def simulate(arrivals, tracks, head, disk_size, algo="FCFS", direction="outward",
+             track_time=0.1, service_time=1.0, batch_size=scheduler.NSTEP_SIZE, drive=None):
+    """Replay timed requests and return ``(order, finish_times, total_seek)``.
+
+    ``arrivals`` must be non-decreasing. ``order`` lists request indices in
+    the order they were served, and ``finish_times[i]`` is when request ``i``
+    completed. ``batch_size`` applies to N-step SCAN. With ``drive`` set,
+    ``track_time`` and ``service_time`` are ignored.
+    """
+    if algo not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algo}")
+    arrivals = np.asarray(arrivals, dtype=np.float64)
+    if np.any(np.diff(arrivals) < 0):
+        raise ValueError("Arrival times must be non-decreasing.")
+    times = arrivals.tolist()
+    track_list = np.asarray(tracks).tolist()
+    n = len(times)
+    order = []
+    finish = np.empty(n, dtype=np.float64)
+    outward = direction == "outward"
+    at_end = _AT_END.get(algo)
+    clock = 0.0
+    seek = 0
+    arrived = 0
+    # Whether requests on the head's track count as ahead when moving inward
+    include_head = algo == "N-STEP SCAN"
+    active = SortedIndex()
+    incoming = deque()
+    # Milliseconds to move the head a given number of tracks
+    if drive is None:
+        move_time = partial(mul, track_time)
+    else:
+        move_time = drive.seek_timer(disk_size)
+        service_time = drive.service_ms
+
+    while len(order) < n:
+        if arrived == len(order):
+            clock = max(clock, times[arrived])
+        while arrived < n and times[arrived] <= clock:
+            if algo in _BATCHED:
+                incoming.append(arrived)
+            elif algo != "FCFS":
+                active.add(track_list[arrived] * n + arrived)
+            arrived += 1
+        if algo in _BATCHED and not active:
+            # Start the next batch: up to batch_size requests for N-step SCAN,
+            # everything that has queued up for FSCAN
+            take = len(incoming) if algo == "FSCAN" else min(batch_size, len(incoming))
+            for _ in range(take):
+                idx = incoming.popleft()
+                active.add(track_list[idx] * n + idx)
+
+        if algo == "FCFS":
+            idx = len(order)
+        elif algo == "SSTF":
+            above = active.ceiling(head * n)
+            below = active.floor(head * n - 1)
+            if below is not None:
+                below = active.ceiling((below // n) * n)
+            if above is None:
+                key = below
+            elif below is None:
+                key = above
+            else:
+                gap_below = head - below // n
+                gap_above = above // n - head
+                if gap_below != gap_above:
+                    key = below if gap_below < gap_above else above
+                else:
+                    key = below if below % n < above % n else above
+            active.remove(key)
+            idx = key % n
+        else:
+            key = _next_in_direction(active, head, n, outward, include_head)
+            if key is None:
+                moves, head, outward = _turn(at_end, active, head, n, disk_size, outward)
+                include_head = True
+                for dist in moves:
+                    seek += dist
+                    clock += move_time(dist)
+                continue
+            active.remove(key)
+            idx = key % n
+
+        dist = abs(head - track_list[idx])
+        seek += dist
+        clock += move_time(dist) + service_time
+        head = track_list[idx]
+        include_head = True
+        finish[idx] = clock
+        order.append(idx)
+
+    return np.array(order, dtype=np.int64), finish, seek
+
+
+def _next_in_direction(active, head, n, outward, include_head=True):
+    """Key of the next pending request ahead of the head, or None.
+
+    Moving inward, requests on the head's own track only count with ``include_head``.
+    """
+    if outward:
+        return active.ceiling(head * n)
+    key = active.floor(head * n + n - 1 if include_head else head * n - 1)
+    if key is None:
+        return None
+    # Serve the earliest arrival on that track first
+    return active.ceiling((key // n) * n)
+
+
+def _turn(at_end, active, head, n, disk_size, outward):
+    """Move the head when nothing is pending ahead; return ``(moves, head, outward)``.
+
+    ``moves`` holds the distance of each separate seek.
+    """
+    end = disk_size - 1 if outward else 0
+    if at_end == "reverse_at_end":
+        return (abs(end - head),), end, not outward
+    if at_end == "wrap_at_end":
+        return (abs(end - head), disk_size - 1), disk_size - 1 - end, outward
+    if at_end == "reverse":
+        return (), head, not outward
+    # C-LOOK: jump straight to the farthest pending request on the other side
+    target = (active.first() if outward else active.last()) // n
+    return (abs(head - target),), target, outward
+
+
+def metrics(arrivals, finish_times, total_seek):
+    """Summarize a simulation run as a dict of plain numbers.
+
+    Response time is the time from arrival to completion. Queue depth counts
+    requests in the system, both waiting and in service. The mean comes from
+    Little's law and the maximum is sampled at each arrival.
+    """
+    arrivals = np.asarray(arrivals, dtype=np.float64)
+    n = len(arrivals)
+    response = finish_times - arrivals
+    makespan = float(finish_times.max() - arrivals.min())
+    completed = np.searchsorted(np.sort(finish_times), arrivals, side="right")
+    depth = np.arange(1, n + 1) - completed
+    result = {
+        "requests": n,
+        "total_seek": int(total_seek),
+        "makespan_ms": makespan,
+        "throughput_per_ms": n / makespan if makespan > 0 else float("inf"),
+        "response_mean_ms": float(response.mean()),
+    }
+    for p, value in zip(PERCENTILES, np.percentile(response, PERCENTILES)):
+        result[f"response_p{p}_ms"] = float(value)
+    result["queue_depth_mean"] = float(response.sum() / makespan) if makespan > 0 else 0.0
+    result["queue_depth_max"] = int(depth.max())
+    return result
@@ -0,0 +1,91 @@
+"""Incrementally maintained sorted multiset of integers.
+
+The elevator algorithms need the nearest pending request at or beyond the
+head while new requests keep arriving. Re-sorting the queue for each batch
+costs O(n log n) every time. A single sorted list makes each insertion an
+O(n) memmove. ``SortedIndex`` keeps the values in a list of short sorted
+buckets plus a list of each bucket's maximum, the layout used by
+``sortedcontainers``. Locating a value is two binary searches, and an insert
+or removal only shifts elements within one bucket.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+DEFAULT_LOAD = 512
+
+
+class SortedIndex:
+    def __init__(self, values=(), load=DEFAULT_LOAD):
+        self.load = load
+        values = sorted(values)
+        self.buckets = [values[i:i + load] for i in range(0, len(values), load)]
+        self.maxes = [bucket[-1] for bucket in self.buckets]
+        self.size = len(values)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket
+
+    def add(self, value):
+        self.size += 1
+        if not self.buckets:
+            self.buckets.append([value])
+            self.maxes.append(value)
+            return
+        i = bisect_left(self.maxes, value)
+        if i == len(self.maxes):
+            i -= 1
+            self.buckets[i].append(value)
+            self.maxes[i] = value
+        else:
+            insort(self.buckets[i], value)
+        bucket = self.buckets[i]
+        if len(bucket) > 2 * self.load:
+            # Split an overgrown bucket in half
+            self.buckets.insert(i + 1, bucket[self.load:])
+            del bucket[self.load:]
+            self.maxes.insert(i, bucket[-1])
+
+    def ceiling(self, value):
+        """Smallest stored value ``>= value``, or None."""
+        i = bisect_left(self.maxes, value)
+        if i == len(self.maxes):
+            return None
+        bucket = self.buckets[i]
+        return bucket[bisect_left(bucket, value)]
+
+    def floor(self, value):
+        """Largest stored value ``<= value``, or None."""
+        i = bisect_left(self.maxes, value)
+        if i < len(self.maxes):
+            bucket = self.buckets[i]
+            j = bisect_right(bucket, value)
+            if j:
+                return bucket[j - 1]
+        return self.buckets[i - 1][-1] if i else None
+
+    def first(self):
+        return self.buckets[0][0] if self.buckets else None
+
+    def last(self):
+        return self.maxes[-1] if self.maxes else None
+
+    def remove(self, value):
+        """Remove one occurrence of ``value``; raise ValueError if absent."""
+        i = bisect_left(self.maxes, value)
+        if i < len(self.maxes):
+            bucket = self.buckets[i]
+            j = bisect_left(bucket, value)
+            if j < len(bucket) and bucket[j] == value:
+                del bucket[j]
+                self.size -= 1
+                if not bucket:
+                    del self.buckets[i]
+                    del self.maxes[i]
+                elif j == len(bucket):
+                    self.maxes[i] = bucket[-1]
+                return
+        raise ValueError(f"{value} not in index")
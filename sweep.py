@@ -0,0 +1,175 @@
+"""Total seek for every starting head position.
+
+Instead of re-running the engine once per head position, the totals are
+derived from the sorted requests:
+
+* FCFS: ``|h - r[0]|`` plus the fixed cost of the request order.
+* SCAN and C-SCAN: the head always runs to one end of the disk, so the total
+  is the distance to that end plus the distance to the farthest or nearest
+  request on the other side of ``h``. That request is found with a binary
+  search, O(log n) per head. LOOK and C-LOOK follow the same pattern but
+  turn at the outermost request.
+* SSTF: the two-pointer walk of ``scheduler.sstf`` is run for all head
+  positions at once with NumPy, one vectorized step per distinct track.
+  That is O(k) per head for k distinct tracks, O(k * disk_size) in total,
+  so sweeps above ``SSTF_SWEEP_LIMIT`` steps are refused.
+
+Algorithms without a closed form here (N-step SCAN) are simulated once per
+head position in pure Python. That is slow, so they are capped at
+``SIMULATED_SWEEP_LIMIT`` requests times heads and left out of ``sweep_all``.
+
+All results match ``scheduler.run`` exactly. Every sweep takes an optional
+array of head positions. On a large disk, ``sample_heads`` picks evenly
+spaced ones, so the result and its plot stay at a fixed size instead of
+one value per track.
+"""
+
+import numpy as np
+
+import scheduler
+
+CONFIGS = scheduler.configs()
+config_name = scheduler.config_name
+# Head-position steps an SSTF sweep may take (distinct tracks x heads), about 2 s
+SSTF_SWEEP_LIMIT = 10**8
+# Requests x heads for algorithms simulated once per head, about 3 s
+SIMULATED_SWEEP_LIMIT = 10**6
+CLOSED_FORM = {"FCFS", "SSTF", "SCAN", "FSCAN", "C-SCAN", "LOOK", "C-LOOK"}
+# Head positions evaluated on large disks, about one per pixel of a plot
+MAX_HEADS = 2000
+
+
+def sample_heads(disk_size, limit=MAX_HEADS, include=()):
+    """Every head position on a small disk, ``limit`` evenly spaced ones otherwise.
+
+    Positions in ``include`` are always added.
+    """
+    if disk_size <= limit:
+        heads = np.arange(disk_size, dtype=np.int64)
+    else:
+        heads = np.round(np.linspace(0, disk_size - 1, limit)).astype(np.int64)
+    return np.union1d(heads, np.asarray(include, dtype=np.int64))
+
+
+def check_sweep(algo, requests, heads):
+    """Raise ValueError if sweeping ``heads`` head positions of ``algo`` would take too long."""
+    if algo == "SSTF":
+        work = len(np.unique(requests)) * heads
+        if work > SSTF_SWEEP_LIMIT:
+            raise ValueError(f"SSTF sweep needs {work} steps (limit {SSTF_SWEEP_LIMIT}); "
+                             "use fewer distinct tracks or a smaller disk.")
+    elif algo not in CLOSED_FORM:
+        work = len(requests) * heads
+        if work > SIMULATED_SWEEP_LIMIT:
+            raise ValueError(f"{algo} is simulated per head position and would need {work} steps "
+                             f"(limit {SIMULATED_SWEEP_LIMIT}); use fewer requests or a smaller disk.")
+
+
+def head_sweep(algo, requests, disk_size, direction="outward", heads=None):
+    """Total seek of ``algo`` for each of ``heads`` (default: every position ``0..disk_size-1``)."""
+    heads = np.arange(disk_size, dtype=np.int64) if heads is None else np.asarray(heads, dtype=np.int64)
+    check_sweep(algo, requests, len(heads))
+    requests = np.asarray(requests, dtype=np.int64)
+    end = disk_size - 1
+    if algo == "FCFS":
+        fixed = int(np.abs(np.diff(requests)).sum())
+        return np.abs(heads - requests[0]) + fixed
+    if algo == "SSTF":
+        return _sstf_sweep(requests, heads)
+
+    tracks = np.sort(requests)
+    # Index of the first request at or beyond each head position
+    split = np.searchsorted(tracks, heads)
+    has_left = split > 0
+    has_right = split < len(tracks)
+    if algo in ("SCAN", "FSCAN"):
+        if direction == "outward":
+            return (end - heads) + np.where(has_left, end - tracks[0], 0)
+        return heads + np.where(has_right, tracks[-1], 0)
+    if algo == "C-SCAN":
+        if direction == "outward":
+            nearest_left = tracks[np.maximum(split - 1, 0)]
+            return (end - heads) + end + np.where(has_left, nearest_left, 0)
+        nearest_right = tracks[np.minimum(split, len(tracks) - 1)]
+        return heads + end + np.where(has_right, end - nearest_right, 0)
+    lowest, highest = tracks[0], tracks[-1]
+    if algo == "LOOK":
+        if direction == "outward":
+            turn = np.where(has_right, highest, heads)
+            return np.where(has_right, highest - heads, 0) + np.where(has_left, turn - lowest, 0)
+        turn = np.where(has_left, lowest, heads)
+        return np.where(has_left, heads - lowest, 0) + np.where(has_right, highest - turn, 0)
+    if algo == "C-LOOK":
+        if direction == "outward":
+            nearest_left = tracks[np.maximum(split - 1, 0)]
+            turn = np.where(has_right, highest, heads)
+            return (np.where(has_right, highest - heads, 0)
+                    + np.where(has_left, np.abs(turn - lowest) + nearest_left - lowest, 0))
+        nearest_right = tracks[np.minimum(split, len(tracks) - 1)]
+        turn = np.where(has_left, lowest, heads)
+        return (np.where(has_left, heads - lowest, 0)
+                + np.where(has_right, np.abs(highest - turn) + highest - nearest_right, 0))
+    if algo in scheduler.REGISTRY:
+        as_list = requests.tolist()
+        return np.array([scheduler.run(algo, as_list, h, disk_size, direction)[1] for h in heads.tolist()],
+                        dtype=np.int64)
+    raise ValueError(f"Unknown algorithm: {algo}")
+
+
+def _sstf_sweep(requests, heads):
+    tracks, first = np.unique(requests, return_index=True)
+    k = len(tracks)
+    hi = np.searchsorted(tracks, heads)
+    lo = hi - 1
+    pos = heads.copy()
+    total = np.zeros(len(heads), dtype=np.int64)
+    far = np.iinfo(np.int64).max
+    for _ in range(k):
+        lo_c = np.maximum(lo, 0)
+        hi_c = np.minimum(hi, k - 1)
+        below = np.where(lo >= 0, pos - tracks[lo_c], far)
+        above = np.where(hi < k, tracks[hi_c] - pos, far)
+        go_low = (below < above) | ((below == above) & (first[lo_c] < first[hi_c]))
+        nxt = np.where(go_low, tracks[lo_c], tracks[hi_c])
+        total += np.abs(nxt - pos)
+        pos = nxt
+        lo -= go_low
+        hi += ~go_low
+    return total
+
+
+def sweepable(algo, requests, heads):
+    try:
+        check_sweep(algo, requests, heads)
+    except ValueError:
+        return False
+    return True
+
+
+def sweep_all(requests, disk_size, heads=None):
+    """Head sweeps for the closed-form configurations in ``CONFIGS``, keyed by display name.
+
+    Configurations over their size limit are left out.
+    """
+    count = disk_size if heads is None else len(heads)
+    return {config_name(algo, direction): head_sweep(algo, requests, disk_size, direction, heads)
+            for algo, direction in CONFIGS if algo in CLOSED_FORM and sweepable(algo, requests, count)}
+
+
+def size_sweep(algo, requests, disk_sizes, direction="outward", heads=None):
+    """Head sweeps over several disk sizes as a 2-D array.
+
+    Row ``i`` holds the totals for ``disk_sizes[i]`` and column ``j`` those
+    for ``heads[j]`` (default: every position on the largest disk). Head
+    positions past the end of a smaller disk are NaN.
+    """
+    disk_sizes = list(disk_sizes)
+    if min(disk_sizes) <= int(np.max(requests)):
+        raise ValueError("Every disk size must be larger than the largest request.")
+    heads = np.arange(max(disk_sizes), dtype=np.int64) if heads is None else np.asarray(heads, dtype=np.int64)
+    check_sweep(algo, requests, sum(int(np.count_nonzero(heads < size)) for size in disk_sizes))
+    grid = np.full((len(disk_sizes), len(heads)), np.nan)
+    for row, size in enumerate(disk_sizes):
+        valid = heads < size
+        grid[row, valid] = head_sweep(algo, requests, size, direction, heads[valid])
+    return grid
@@ -0,0 +1,57 @@
+import random
+
+import scheduler
+
+
+def reference_sstf(requests, head, trace=None):
+    """The original quadratic SSTF: min() over the pending list, then list.remove()."""
+    req = list(requests)
+    sequence = [head]
+    seek = 0
+    if trace:
+        trace("SSTF: Starting algorithm execution...")
+    while req:
+        closest = min(req, key=lambda x: abs(head - x))
+        step = abs(head - closest)
+        seek += step
+        if trace:
+            trace(f"SSTF: Moving from {head} to {closest}, Seek increment: {step}")
+        head = closest
+        sequence.append(closest)
+        req.remove(closest)
+    return sequence, seek
+
+
+def check_sstf(requests, head):
+    expected_log, log = [], []
+    expected = reference_sstf(requests, head, trace=expected_log.append)
+    assert scheduler.sstf(requests, head, trace=log.append) == expected
+    assert log == expected_log
+    assert scheduler.sstf(requests, head) == expected
+
+
+def test_sstf_matches_reference_with_ties():
+    rng = random.Random(0)
+    for _ in range(1000):
+        # A small disk gives many duplicate tracks and equidistant choices
+        disk_size = rng.randint(1, 30)
+        requests = [rng.randrange(disk_size) for _ in range(rng.randint(0, 40))]
+        check_sstf(requests, rng.randrange(disk_size))
+
+
+def test_sstf_matches_reference_on_large_disk():
+    rng = random.Random(1)
+    for _ in range(100):
+        requests = [rng.randrange(10000) for _ in range(rng.randint(1, 300))]
+        check_sstf(requests, rng.randrange(10000))
+
+
+def test_sstf_equidistant_tie_follows_input_order():
+    assert scheduler.sstf([60, 40], 50) == ([50, 60, 40], 30)
+    assert scheduler.sstf([40, 60], 50) == ([50, 40, 60], 30)
+
+
+def test_sstf_edge_cases():
+    check_sstf([], 10)
+    check_sstf([10, 10, 10], 10)
+    check_sstf([0, 199], 199)
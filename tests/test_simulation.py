@@ -0,0 +1,40 @@
+import random
+
+import numpy as np
+import pytest
+
+import scheduler
+import simulation
+
+# These never move the head past the last request, so whole runs compare
+EXACT = ["FCFS", "SSTF", "LOOK", "C-LOOK"]
+
+
+def random_cases(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        disk_size = rng.randint(2, 30)
+        requests = [rng.randrange(disk_size) for _ in range(rng.randint(1, 25))]
+        yield requests, rng.randrange(disk_size), disk_size
+
+
+@pytest.mark.parametrize("algo,direction", scheduler.configs())
+def test_all_queued_at_zero_matches_scheduler(algo, direction):
+    for requests, head, disk_size in random_cases(0, 500):
+        # scheduler's SCAN and C-SCAN run to the disk end even with nothing left behind the
+        # head; the simulation stops at the last request, so only compare when both sides are busy
+        if algo not in EXACT and not (min(requests) < head <= max(requests)):
+            continue
+        arrivals = np.zeros(len(requests))
+        order, _, seek = simulation.simulate(arrivals, requests, head, disk_size, algo, direction)
+        sequence, expected = scheduler.run(algo, requests, head, disk_size, direction)
+        assert seek == expected, (requests, head, disk_size)
+        if algo in EXACT:
+            assert [requests[i] for i in order] == sequence[1:]
+
+
+def test_inward_leaves_the_head_track_for_the_way_back():
+    requests = [4, 11, 15, 2, 0, 15, 8, 7, 6, 15]
+    for algo in ("SCAN", "C-SCAN", "LOOK", "C-LOOK", "FSCAN"):
+        _, _, seek = simulation.simulate(np.zeros(len(requests)), requests, 15, 17, algo, "inward")
+        assert seek == scheduler.run(algo, requests, 15, 17, "inward")[1]
@@ -0,0 +1,47 @@
+import random
+from bisect import bisect_left, bisect_right, insort
+
+import pytest
+
+from sortedindex import SortedIndex
+
+
+def check(index, reference, rng):
+    assert len(index) == len(reference)
+    assert list(index) == reference
+    assert index.first() == (reference[0] if reference else None)
+    assert index.last() == (reference[-1] if reference else None)
+    for value in [rng.randrange(-5, 105) for _ in range(5)]:
+        i = bisect_left(reference, value)
+        assert index.ceiling(value) == (reference[i] if i < len(reference) else None)
+        j = bisect_right(reference, value)
+        assert index.floor(value) == (reference[j - 1] if j else None)
+
+
+@pytest.mark.parametrize("load", [1, 2, 4, 512])
+def test_matches_sorted_list(load):
+    rng = random.Random(load)
+    initial = [rng.randrange(100) for _ in range(rng.randint(0, 50))]
+    index = SortedIndex(initial, load=load)
+    reference = sorted(initial)
+    for _ in range(2000):
+        if reference and rng.random() < 0.45:
+            value = rng.choice(reference)
+            index.remove(value)
+            reference.remove(value)
+        else:
+            value = rng.randrange(100)
+            index.add(value)
+            insort(reference, value)
+        check(index, reference, rng)
+
+
+def test_remove_missing_raises():
+    index = SortedIndex([1, 3, 3], load=1)
+    with pytest.raises(ValueError):
+        index.remove(2)
+    index.remove(3)
+    index.remove(3)
+    with pytest.raises(ValueError):
+        index.remove(3)
+    assert list(index) == [1]
@@ -0,0 +1,50 @@
+import random
+
+import numpy as np
+import pytest
+
+import scheduler
+import sweep
+
+
+def per_head(algo, requests, disk_size, direction, heads):
+    return [scheduler.run(algo, requests, h, disk_size, direction)[1] for h in heads]
+
+
+@pytest.mark.parametrize("algo,direction", scheduler.configs())
+def test_head_sweep_matches_scheduler(algo, direction):
+    rng = random.Random(0)
+    for _ in range(100):
+        disk_size = rng.randint(1, 40)
+        requests = [rng.randrange(disk_size) for _ in range(rng.randint(1, 25))]
+        totals = sweep.head_sweep(algo, requests, disk_size, direction)
+        assert totals.tolist() == per_head(algo, requests, disk_size, direction, range(disk_size)), requests
+
+
+@pytest.mark.parametrize("algo,direction", scheduler.configs())
+def test_sampled_heads_match_scheduler(algo, direction):
+    rng = random.Random(1)
+    disk_size = 5000
+    requests = [rng.randrange(disk_size) for _ in range(50)]
+    heads = sweep.sample_heads(disk_size, limit=40, include=[1234])
+    assert len(heads) == 41 and heads[0] == 0 and heads[-1] == disk_size - 1
+    totals = sweep.head_sweep(algo, requests, disk_size, direction, heads)
+    assert totals.tolist() == per_head(algo, requests, disk_size, direction, heads.tolist())
+
+
+def test_size_sweep_rows_match_head_sweeps():
+    requests = [3, 17, 8, 25, 8]
+    sizes = [30, 40, 60]
+    heads = sweep.sample_heads(60, limit=20)
+    grid = sweep.size_sweep("C-SCAN", requests, sizes, "inward", heads)
+    for row, size in zip(grid, sizes):
+        valid = heads < size
+        assert np.isnan(row[~valid]).all()
+        assert row[valid].tolist() == per_head("C-SCAN", requests, size, "inward", heads[valid].tolist())
+
+
+def test_sweep_all_leaves_out_simulated_algorithms():
+    results = sweep.sweep_all([5, 1, 9], 12)
+    expected = {sweep.config_name(algo, direction) for algo, direction in sweep.CONFIGS
+                if algo in sweep.CLOSED_FORM}
+    assert set(results) == expected
@@ -0,0 +1,38 @@
+import random
+
+import numpy as np
+import pytest
+
+import scheduler
+import vectorized
+
+
+def random_cases(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        disk_size = rng.randint(1, 40)
+        requests = [rng.randrange(disk_size) for _ in range(rng.randint(0, 30))]
+        yield requests, rng.randrange(disk_size), disk_size
+
+
+@pytest.mark.parametrize("algo,direction", scheduler.configs())
+def test_matches_scheduler(algo, direction):
+    for requests, head, disk_size in random_cases(0, 300):
+        expected, seek = scheduler.run(algo, requests, head, disk_size, direction)
+        sequence, increments, total = vectorized.run(algo, np.array(requests, dtype=np.int64), head,
+                                                     disk_size, direction)
+        assert sequence.tolist() == expected, (requests, head, disk_size)
+        assert total == seek
+        assert increments.tolist() == np.abs(np.diff(expected)).tolist()
+
+
+@pytest.mark.parametrize("algo,direction", scheduler.configs())
+def test_disk_past_int32_falls_back_to_int64(algo, direction):
+    disk_size = 2**32
+    requests = [2**31 + 5, 3, 2**32 - 1, 2**31 - 1, 7]
+    head = 2**31
+    expected, seek = scheduler.run(algo, requests, head, disk_size, direction)
+    sequence, _, total = vectorized.run(algo, np.array(requests, dtype=np.int64), head, disk_size, direction)
+    assert sequence.dtype == np.int64
+    assert sequence.tolist() == expected
+    assert total == seek
@@ -0,0 +1,177 @@
+"""Loading request traces from files.
+
+Three formats are supported:
+
+* CSV, one request per row, with the track number in a chosen column.
+* blkparse text output (the default ``blkparse`` line format), where the
+  sector of each event with the chosen action is mapped to a track.
+* A compact binary format: a flat file of little-endian int32 track numbers.
+
+Text traces are parsed as int64, since raw sector numbers of disks over
+1 TiB do not fit in 32 bits. Each chunk is narrowed to int32 when all of its
+values fit.
+
+The ``iter_*`` functions read a file in chunks of at most ``chunk_rows``
+requests and yield NumPy arrays, so arbitrarily large traces can be processed
+in bounded memory. ``load_trace`` returns the whole trace as one array. For
+binary files it is a read-only memory map, so opening is instant and pages are
+only read as the engine touches them. ``convert_to_binary`` turns a text trace
+into that format once, so later runs can memory-map it.
+"""
+
+import os
+from itertools import islice
+
+import numpy as np
+
+TRACK_DTYPE = np.int32
+BINARY_DTYPE = np.dtype("<i4")
+CHUNK_ROWS = 1 << 20
+BINARY_EXTENSIONS = (".bin", ".i32")
+PARSE_DTYPE = np.int64
+
+
+def _narrow(tracks):
+    """Copy of ``tracks`` as int32 when every value fits, int64 otherwise."""
+    info = np.iinfo(TRACK_DTYPE)
+    if len(tracks) == 0 or (tracks.min() >= info.min and tracks.max() <= info.max):
+        return tracks.astype(TRACK_DTYPE)
+    return tracks.copy()
+
+
+def iter_csv(path, column=0, skip_header=False, chunk_rows=CHUNK_ROWS):
+    """Yield arrays of track numbers from ``column`` of a CSV file."""
+    with open(path) as f:
+        if skip_header:
+            next(f, None)
+        while True:
+            lines = list(islice(f, chunk_rows))
+            if not lines:
+                return
+            chunk = np.loadtxt(lines, delimiter=",", usecols=column, dtype=PARSE_DTYPE, ndmin=1)
+            if len(chunk):
+                yield _narrow(chunk)
+
+
+def iter_blktrace(path, action="D", sectors_per_track=1, chunk_rows=CHUNK_ROWS):
+    """Yield ``(times, tracks)`` arrays from blkparse text output.
+
+    Only events whose action field equals ``action`` are kept ("D" is the
+    request being issued to the device, "Q" is the request being queued).
+    Lines that do not look like events, such as the per-CPU summary blkparse
+    prints at the end, are skipped. Each sector is divided by
+    ``sectors_per_track`` to give its track.
+    """
+    if sectors_per_track < 1:
+        raise ValueError("Sectors per track must be at least 1.")
+    times = np.empty(chunk_rows, dtype=np.float64)
+    tracks = np.empty(chunk_rows, dtype=PARSE_DTYPE)
+    n = 0
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            # dev cpu seq time pid action rwbs sector + count [process]
+            if len(fields) < 8 or fields[5] != action or not fields[7].isdigit():
+                continue
+            times[n] = float(fields[3])
+            tracks[n] = int(fields[7]) // sectors_per_track
+            n += 1
+            if n == chunk_rows:
+                yield times.copy(), _narrow(tracks)
+                n = 0
+    if n:
+        yield times[:n].copy(), _narrow(tracks[:n])
+
+
+def iter_binary(path, chunk_rows=CHUNK_ROWS):
+    """Yield consecutive views of a binary int32 trace."""
+    tracks = load_binary(path)
+    for start in range(0, len(tracks), chunk_rows):
+        yield tracks[start:start + chunk_rows]
+
+
+def load_binary(path):
+    """Memory-map a binary int32 trace without reading it."""
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=BINARY_DTYPE)
+    return np.memmap(path, dtype=BINARY_DTYPE, mode="r")
+
+
+def save_binary(path, tracks):
+    np.asarray(tracks, dtype=BINARY_DTYPE).tofile(path)
+
+
+def convert_to_binary(src, dst, fmt=None, **options):
+    """Stream a text trace into the binary format and return the request count."""
+    count = 0
+    info = np.iinfo(BINARY_DTYPE)
+    with open(dst, "wb") as out:
+        for chunk in _iter_tracks(src, fmt, **options):
+            if len(chunk) and (chunk.min() < info.min or chunk.max() > info.max):
+                raise ValueError("Tracks do not fit the int32 binary format; use sectors_per_track to scale them.")
+            chunk.astype(BINARY_DTYPE, copy=False).tofile(out)
+            count += len(chunk)
+    return count
+
+
+def guess_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in BINARY_EXTENSIONS:
+        return "binary"
+    if ext == ".csv":
+        return "csv"
+    return "blktrace"
+
+
+def _iter_tracks(path, fmt=None, **options):
+    fmt = fmt or guess_format(path)
+    if fmt == "csv":
+        return iter_csv(path, **options)
+    elif fmt == "blktrace":
+        return (tracks for _, tracks in iter_blktrace(path, **options))
+    elif fmt == "binary":
+        return iter_binary(path, **options)
+    raise ValueError(f"Unknown trace format: {fmt}")
+
+
+def load_trace(path, fmt=None, **options):
+    """Load the track numbers of a trace file as a single array.
+
+    ``fmt`` is "csv", "blktrace" or "binary"; by default it is guessed from
+    the file extension. Extra keyword arguments go to the matching ``iter_*``
+    function.
+    """
+    fmt = fmt or guess_format(path)
+    if fmt == "binary":
+        return load_binary(path)
+    chunks = list(_iter_tracks(path, fmt, **options))
+    if not chunks:
+        return np.empty(0, dtype=TRACK_DTYPE)
+    return np.concatenate(chunks)
+
+
+def load_blktrace(path, **options):
+    """Load blkparse output as ``(times, tracks)`` arrays."""
+    chunks = list(iter_blktrace(path, **options))
+    if not chunks:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=TRACK_DTYPE)
+    times, tracks = zip(*chunks)
+    return np.concatenate(times), np.concatenate(tracks)
+
+
+def validate_tracks(tracks, disk_size, chunk_rows=CHUNK_ROWS):
+    """Raise ValueError if any track is outside ``0..disk_size-1``.
+
+    The check runs chunk by chunk so that validating a memory-mapped trace
+    does not allocate a mask the size of the whole file.
+    """
+    if len(tracks) == 0:
+        raise ValueError("Please enter at least one disk request.")
+    for start in range(0, len(tracks), chunk_rows):
+        chunk = tracks[start:start + chunk_rows]
+        bad = chunk[(chunk < 0) | (chunk >= disk_size)]
+        if len(bad):
+            shown = ", ".join(str(t) for t in bad[:10])
+            if len(bad) > 10:
+                shown += ", ..."
+            raise ValueError(f"Request(s) {shown} outside disk of size {disk_size}.")
@@ -0,0 +1,123 @@
+"""NumPy implementation of the scheduling engine.
+
+These functions produce the same service order and total seek as the ones in
+``scheduler`` but build the order with ``np.sort`` and ``np.searchsorted``
+and compute the seek distances with ``np.diff``, so there is no Python-level
+loop per request for FCFS, SCAN and C-SCAN. They return
+``(sequence, increments, total_seek)`` where ``increments[i]`` is the
+distance travelled from ``sequence[i]`` to ``sequence[i + 1]``.
+
+Both arrays are int32 whenever the disk fits (``traces.TRACK_DTYPE``). The
+requests are sorted once into a single copy, and the left and right
+partitions are ``searchsorted`` views of it. Each part is written straight
+into a preallocated sequence, and the increments are computed in place, so a
+run holds about three int32 arrays of the workload's length at its peak.
+
+Algorithms without a vectorized form here (N-step SCAN) fall back to the
+``scheduler`` implementation, with the result converted to arrays.
+
+Tracing is not supported here; use ``scheduler`` for step-by-step logs.
+"""
+
+import numpy as np
+
+import scheduler
+from traces import TRACK_DTYPE
+
+
+def _dtype(requests, head, disk_size=None):
+    """int32 if every track on the disk fits, int64 otherwise."""
+    if disk_size is None:
+        disk_size = max(head, int(requests.max()) if len(requests) else 0) + 1
+    return TRACK_DTYPE if disk_size - 1 <= np.iinfo(TRACK_DTYPE).max else np.int64
+
+
+def _finish(parts, dtype):
+    sequence = np.empty(sum(len(p) for p in parts), dtype=dtype)
+    pos = 0
+    for part in parts:
+        sequence[pos:pos + len(part)] = part
+        pos += len(part)
+    increments = np.diff(sequence)
+    np.abs(increments, out=increments)
+    return sequence, increments, int(increments.sum(dtype=np.int64))
+
+
+def fcfs(requests, head, disk_size=None):
+    requests = np.asarray(requests)
+    return _finish([[head], requests], _dtype(requests, head, disk_size))
+
+
+def sstf(requests, head, disk_size=None):
+    # Tie-breaking depends on the order requests were submitted, so the walk
+    # itself stays in scheduler.sstf; only the result is converted here.
+    requests = np.asarray(requests)
+    sequence, _ = scheduler.sstf(requests.tolist(), head)
+    return _finish([sequence], _dtype(requests, head, disk_size))
+
+
+def _partition(requests, head, disk_size):
+    """Sort once and split at the head into ``(left, right, dtype)``; both are views."""
+    requests = np.asarray(requests)
+    dtype = _dtype(requests, head, disk_size)
+    tracks = requests.astype(dtype)
+    tracks.sort()
+    split = np.searchsorted(tracks, head)
+    return tracks[:split], tracks[split:], dtype
+
+
+def scan(requests, head, disk_size, direction="outward"):
+    left, right, dtype = _partition(requests, head, disk_size)
+    if direction == "outward":
+        last = right[-1] if len(right) else head
+        turn = [disk_size - 1] if last != disk_size - 1 else []
+        return _finish([[head], right, turn, left[::-1]], dtype)
+    last = left[0] if len(left) else head
+    turn = [0] if last != 0 else []
+    return _finish([[head], left[::-1], turn, right], dtype)
+
+
+def cscan(requests, head, disk_size, direction="outward"):
+    left, right, dtype = _partition(requests, head, disk_size)
+    if direction == "outward":
+        last = right[-1] if len(right) else head
+        turn = [disk_size - 1] if last != disk_size - 1 else []
+        return _finish([[head], right, turn, [0], left], dtype)
+    last = left[0] if len(left) else head
+    turn = [0] if last != 0 else []
+    return _finish([[head], left[::-1], turn, [disk_size - 1], right[::-1]], dtype)
+
+
+def look(requests, head, disk_size, direction="outward"):
+    left, right, dtype = _partition(requests, head, disk_size)
+    if direction == "outward":
+        return _finish([[head], right, left[::-1]], dtype)
+    return _finish([[head], left[::-1], right], dtype)
+
+
+def clook(requests, head, disk_size, direction="outward"):
+    left, right, dtype = _partition(requests, head, disk_size)
+    if direction == "outward":
+        return _finish([[head], right, left], dtype)
+    return _finish([[head], left[::-1], right[::-1]], dtype)
+
+
+VECTORIZED = {
+    "FCFS": lambda requests, head, disk_size, direction: fcfs(requests, head, disk_size),
+    "SSTF": lambda requests, head, disk_size, direction: sstf(requests, head, disk_size),
+    "SCAN": scan,
+    "C-SCAN": cscan,
+    "LOOK": look,
+    "C-LOOK": clook,
+    "FSCAN": scan,
+}
+
+
+def run(algo, requests, head, disk_size, direction="outward"):
+    """Run ``algo`` and return ``(sequence, increments, total_seek)``."""
+    fn = VECTORIZED.get(algo)
+    if fn is not None:
+        return fn(requests, head, disk_size, direction)
+    requests = np.asarray(requests)
+    sequence, _ = scheduler.run(algo, requests.tolist(), head, disk_size, direction)
+    return _finish([sequence], _dtype(requests, head, disk_size))